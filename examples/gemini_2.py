@@ -1,9 +1,49 @@
 import os
+import asyncio
+import logging
+import importlib.util
+import httpx
 from google import genai
 from google.genai import types
 from PIL import Image, ImageDraw, ImageFont, ImageColor # Added ImageDraw, ImageFont, ImageColor
+import cv2
+import numpy as np
+from numba import njit
 import json
-import io # Needed for Image.open(io.BytesIO(...))
+import functools
+import re
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# orjson parses/serializes several times faster than the stdlib; fall back to json when it isn't installed
+try:
+    import orjson
+
+    def json_loads(data: str | bytes):
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# aggdraw (optional) rasterizes all box outlines in a single C pass; PIL's ImageDraw is used without it
+try:
+    import aggdraw
+except ImportError:
+    aggdraw = None
+
+# PyTurboJPEG (optional) encodes RGB frames directly with libjpeg-turbo, skipping OpenCV's BGR conversion;
+# it also needs the libturbojpeg shared library, so fall back to cv2.imencode when either is missing
+try:
+    from turbojpeg import TJPF_RGB, TJSAMP_420, TurboJPEG
+
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbojpeg = None
 
 # --- CONFIGURATION (can be overridden or passed as arguments) ---
 # IMPORTANT: In a production environment, do NOT hardcode API_KEY.
@@ -17,8 +57,33 @@ DEFAULT_BBOX_PROMPT = """
     - Ignore all background objects.
     """
 
-# Initialize the Gemini client once
-client = genai.Client(api_key=API_KEY)
+# Maximum number of Gemini responses kept in the in-process vision cache
+VISION_CACHE_SIZE = 512
+# Longest side of the image sent to Gemini, and JPEG quality used for raw camera frames
+MAX_IMAGE_SIZE = 640
+JPEG_QUALITY = 85
+
+# Gemini request timeout in milliseconds
+REQUEST_TIMEOUT_MS = 30_000
+
+# Keep-alive pool shared by every request (sync and async), so the TLS session is set up once and reused
+# by all agent tools; HTTP/2 multiplexing needs the `h2` package
+_HTTP_CLIENT_ARGS = {"limits": httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)}
+if importlib.util.find_spec("h2") is not None:
+    _HTTP_CLIENT_ARGS["http2"] = True
+
+# We authenticate with an API key, not Vertex AI
+os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "false")
+
+# Initialize the Gemini client once; import `client` from here rather than creating another one
+client = genai.Client(
+    api_key=API_KEY,
+    http_options=types.HttpOptions(
+        timeout=REQUEST_TIMEOUT_MS,
+        client_args=_HTTP_CLIENT_ARGS,
+        async_client_args=_HTTP_CLIENT_ARGS,
+    ),
+)
 
 # Define safety settings
 safety_settings = [
@@ -28,66 +93,314 @@ safety_settings = [
     ),
 ]
 
+# --- Vision cache: skip Gemini when the same image + prompt were already analyzed ---
+_vision_cache: "OrderedDict[int, str]" = OrderedDict()
+# Tools call Gemini from worker threads (thread pools, asyncio.to_thread), so lookups and evictions are serialized
+_vision_cache_lock = threading.Lock()
+
+
+def _vision_cache_key(pixels_header: str, pixels: bytes, user_prompt: str, system_instruction: str) -> int:
+    """
+    Builds a content hash of the image together with the prompt, system instruction and model.
+    The header (MIME type or dtype/shape) is part of the key so two buffers of equal bytes but different
+    formats or shapes don't collide.
+    The cache only lives in this process, so Python's built-in (SipHash) hash is enough; no cryptographic
+    digest is needed.
+    """
+    return hash((pixels_header, pixels, user_prompt, system_instruction, MODEL_NAME))
+
+
+def _vision_cache_get(key: int) -> str | None:
+    with _vision_cache_lock:
+        response_text = _vision_cache.get(key)
+        if response_text is not None:
+            _vision_cache.move_to_end(key)
+    return response_text
+
+
+def _vision_cache_put(key: int, response_text: str) -> None:
+    with _vision_cache_lock:
+        _vision_cache[key] = response_text
+        _vision_cache.move_to_end(key)
+        if len(_vision_cache) > VISION_CACHE_SIZE:
+            _vision_cache.popitem(last=False)
+
 
 # --- Core Function to Analyze Image with Gemini ---
-def analyze_image_with_gemini(image_png_bytes: bytes, user_prompt: str, system_instruction: str = DEFAULT_BBOX_PROMPT) -> str:
+def analyze_image_with_gemini(image_png_bytes: bytes, user_prompt: str, system_instruction: str = DEFAULT_BBOX_PROMPT, mime_type: str = "image/png") -> str:
     """
-    Analyzes a PNG image using the Gemini API and returns the text response.
+    Analyzes an encoded image (PNG by default) using the Gemini API and returns the text response.
+    The encoded bytes are handed to the SDK as-is, without decoding them to a PIL Image first, so the
+    producer is responsible for any resizing (camera frames are already 640x480).
+    Responses are cached by image content and prompt, so an unchanged scene is only sent to Gemini once.
 
     Args:
-        image_png_bytes (bytes): The image data in PNG format.
+        image_png_bytes (bytes): The image data in PNG format (or the format given by `mime_type`).
         user_prompt (str): identify the plate.
         system_instruction (str, optional): An optional system instruction for the model.
                                             Defaults to DEFAULT_BBOX_PROMPT for bounding box detection.
+        mime_type (str, optional): MIME type of `image_png_bytes`. Defaults to "image/png".
 
     Returns:
         str: The raw text response from the Gemini model. This might be JSON if prompted for structured output.
     """
     try:
-        #image = "/home/jony/Downloads/frame_00000.png"
-        #im = Image.open(image)
-        #im.thumbnail([640,640], Image.Resampling.LANCZOS)
-        # Open the PNG bytes as a PIL Image object
-        # The Gemini API `contents` argument can directly take a PIL Image object.
-        pil_image = Image.open(io.BytesIO(image_png_bytes))
-        pil_image.thumbnail([640,640], Image.Resampling.LANCZOS)
+        cache_key = _vision_cache_key(mime_type, image_png_bytes, user_prompt, system_instruction)
+        cached_text = _vision_cache_get(cache_key)
+        if cached_text is not None:
+            return cached_text
 
         # Prepare the contents for the Gemini API call
         contents = [
             user_prompt,
-            pil_image # Pass the PIL Image object
+            types.Part.from_bytes(data=image_png_bytes, mime_type=mime_type),
         ]
+        return _generate_and_cache(contents, system_instruction, cache_key)
+    except Exception as e:
+        print(f"ERROR: Failed to call Gemini API: {e}")
+        return f"ERROR: Gemini API call failed: {e}"
+
+
+# --- Variant for raw camera frames: skips the PNG encode/decode round-trip entirely ---
+def analyze_image_array_with_gemini(img: np.ndarray, user_prompt: str, system_instruction: str = DEFAULT_BBOX_PROMPT) -> str:
+    """
+    Analyzes a raw HxWx3 RGB uint8 frame (e.g. a camera observation) using the Gemini API.
+    The frame is downscaled once with OpenCV and uploaded as JPEG, without any PNG or PIL round-trip.
+
+    Args:
+        img (np.ndarray): The RGB image, shape (H, W, 3), dtype uint8.
+        user_prompt (str): The question to ask about the image.
+        system_instruction (str, optional): An optional system instruction for the model.
+                                            Defaults to DEFAULT_BBOX_PROMPT for bounding box detection.
+
+    Returns:
+        str: The raw text response from the Gemini model. This might be JSON if prompted for structured output.
+    """
+    try:
+        cache_key = _vision_cache_key(f"{img.dtype}:{img.shape}", img.tobytes(), user_prompt, system_instruction)
+        cached_text = _vision_cache_get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
+        contents = [user_prompt, _array_to_jpeg_part(img)]
+        return _generate_and_cache(contents, system_instruction, cache_key)
+    except Exception as e:
+        print(f"ERROR: Failed to call Gemini API: {e}")
+        return f"ERROR: Gemini API call failed: {e}"
+
+
+# --- Async variant: lets several Gemini calls share the keep-alive connection pool concurrently ---
+async def analyze_image_array_with_gemini_async(img: np.ndarray, user_prompt: str, system_instruction: str = DEFAULT_BBOX_PROMPT) -> str:
+    """
+    Async version of analyze_image_array_with_gemini, built on the client's `aio` interface.
+    Several calls can be awaited together with asyncio.gather to turn N sequential round-trips into ~1.
+
+    Args:
+        img (np.ndarray): The RGB image, shape (H, W, 3), dtype uint8.
+        user_prompt (str): The question to ask about the image.
+        system_instruction (str, optional): An optional system instruction for the model.
+                                            Defaults to DEFAULT_BBOX_PROMPT for bounding box detection.
+
+    Returns:
+        str: The raw text response from the Gemini model. This might be JSON if prompted for structured output.
+    """
+    return await analyze_image_arrays_with_gemini_async([img], user_prompt, system_instruction)
 
-        # Call the Gemini API
-        response = client.models.generate_content(
+
+# --- Batched variant: several frames (e.g. one per camera) answered by a single Gemini request ---
+async def analyze_image_arrays_with_gemini_async(imgs: list[np.ndarray], user_prompt: str, system_instruction: str = DEFAULT_BBOX_PROMPT) -> str:
+    """
+    Analyzes several raw RGB frames with one Gemini request: the prompt is followed by one JPEG part per frame,
+    so N views cost a single round-trip and prompt pass instead of N. The model answers for all frames at once
+    (e.g. one list of the objects seen across the views). Responses are cached on all the frames together.
+
+    Args:
+        imgs (list[np.ndarray]): The RGB images, each of shape (H, W, 3) and dtype uint8.
+        user_prompt (str): The question to ask about the images.
+        system_instruction (str, optional): An optional system instruction for the model.
+                                            Defaults to DEFAULT_BBOX_PROMPT for bounding box detection.
+
+    Returns:
+        str: The raw text response from the Gemini model. This might be JSON if prompted for structured output.
+    """
+    try:
+        cache_key = _vision_cache_key(
+            ";".join(f"{img.dtype}:{img.shape}" for img in imgs),
+            b"".join(img.tobytes() for img in imgs),
+            user_prompt,
+            system_instruction,
+        )
+        cached_text = _vision_cache_get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
+        # Encode off the event loop so other in-flight requests keep uploading meanwhile
+        parts = await asyncio.to_thread(lambda: [_array_to_jpeg_part(img) for img in imgs])
+        response = await client.aio.models.generate_content(
             model=MODEL_NAME,
-            contents=contents,
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=0.5, # Temperature from original gemini3.py
-                safety_settings=safety_settings,
-            )
+            contents=[user_prompt, *parts],
+            config=_generation_config(system_instruction),
         )
-        print(f"DEBUG: Gemini API response status: {pil_image,response.text}")
+        logger.debug("Gemini API response: %s", response.text)
+        if response.text is not None:
+            _vision_cache_put(cache_key, response.text)
         return response.text
     except Exception as e:
         print(f"ERROR: Failed to call Gemini API: {e}")
         return f"ERROR: Gemini API call failed: {e}"
 
+
+# Per-thread resize/color-conversion targets, reused across frames of the same size instead of
+# allocating fresh buffers on every call
+_scratch = threading.local()
+
+
+def _get_scratch(name: str, shape: tuple) -> np.ndarray:
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _scratch.buffers = {}
+    key = (name, shape)
+    if key not in buffers:
+        buffers[key] = np.empty(shape, dtype=np.uint8)
+    return buffers[key]
+
+
+def _array_to_jpeg_part(img: np.ndarray) -> types.Part:
+    # Same bounds as PIL's thumbnail: fit inside MAX_IMAGE_SIZE, keep aspect ratio, never upscale
+    height, width = img.shape[:2]
+    scale = MAX_IMAGE_SIZE / max(height, width)
+    if scale < 1:
+        new_width, new_height = round(width * scale), round(height * scale)
+        scratch = _get_scratch("resize", (new_height, new_width) + img.shape[2:])
+        img = cv2.resize(img, (new_width, new_height), dst=scratch, interpolation=cv2.INTER_AREA)
+
+    return types.Part.from_bytes(data=encode_rgb_jpeg(img), mime_type="image/jpeg")
+
+
+def image_obs_to_hwc_uint8(image_obs):
+    """
+    Convert an image observation (numpy array or torch tensor) to an HWC uint8 numpy array.
+    """
+    # torch is only imported for tensor inputs, so importing this module doesn't pull it in
+    if type(image_obs).__module__.startswith("torch"):
+        import torch
+
+        # Convert on the tensor's device before moving it, so a GPU frame crosses to the host as uint8 (a quarter
+        # of the float32 bytes) and a CPU frame needs no numpy round-trip. The uint8 copy is made directly in
+        # HWC order, a CPU uint8 HWC tensor is shared with numpy without any copy
+        t = image_obs.detach()
+        if t.ndim == 3 and t.shape[0] in (1, 3):
+            t = t.permute(1, 2, 0)
+        if t.is_floating_point():
+            t = t.mul(255).clamp_(0, 255).to(torch.uint8, memory_format=torch.contiguous_format)
+        return t.cpu().contiguous().numpy()
+    if not isinstance(image_obs, np.ndarray):
+        raise ValueError("Unsupported image type")
+    # Camera frames are already HWC uint8 and pass through without a copy. Otherwise, transpose CHW to HWC
+    # as a view first, so the single copy made below (dtype conversion or not) is laid out contiguously in HWC
+    # order and the encoder doesn't copy the strided view again
+    if image_obs.shape[0] in [1, 3] and image_obs.ndim == 3:
+        image_obs = np.transpose(image_obs, (1, 2, 0))
+    if image_obs.dtype != np.uint8:
+        image_obs = (255 * np.clip(image_obs, 0, 1)).astype(np.uint8, order="C")
+    return np.ascontiguousarray(image_obs)
+
+
+def encode_rgb_jpeg(img: np.ndarray, quality: int = JPEG_QUALITY) -> bytes:
+    """Encode an RGB uint8 HWC frame as JPEG, with libjpeg-turbo directly when PyTurboJPEG is available."""
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(img, quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+    # OpenCV encodes BGR, camera observations are RGB
+    bgr = cv2.cvtColor(img, cv2.COLOR_RGB2BGR, dst=_get_scratch("bgr", img.shape))
+    ok, jpeg_buf = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise RuntimeError("JPEG encoding failed")
+    return jpeg_buf.tobytes()
+
+
+def _generation_config(system_instruction: str) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        temperature=0.5, # Temperature from original gemini3.py
+        safety_settings=safety_settings,
+    )
+
+
+def _generate_and_cache(contents: list, system_instruction: str, cache_key: int) -> str:
+    # Call the Gemini API
+    response = client.models.generate_content(
+        model=MODEL_NAME,
+        contents=contents,
+        config=_generation_config(system_instruction),
+    )
+    logger.debug("Gemini API response: %s", response.text)
+    if response.text is not None:
+        _vision_cache_put(cache_key, response.text)
+    return response.text
+
+
 # --- Helper to parse JSON output from Gemini response ---
+# Captures the body of a markdown fence (e.g., "```json\n...\n```"), whatever its language tag; an unclosed
+# fence runs to the end
+_FENCE_RE = re.compile(r"```[A-Za-z0-9_-]*\s*(.*?)(?:```|$)", re.DOTALL)
+
+
 def parse_json(json_output: str):
-    # Parsing out the markdown fencing if present (e.g., "```json\n...\n```")
-    lines = json_output.splitlines()
-    for i, line in enumerate(lines):
-        if line.strip() == "```json": # Use strip() for robust matching
-            json_output = "\n".join(lines[i+1:])  # Remove everything before "```json"
-            json_output = json_output.split("```")[0]  # Remove everything after the closing "```"
-            break  # Exit the loop once "```json" is found
+    # Parsing out the markdown fencing if present, in a single regex scan
+    match = _FENCE_RE.search(json_output)
+    if match:
+        json_output = match.group(1)
     return json_output.strip() # Ensure no leading/trailing whitespace
 
 
+# --- Plotting resources, loaded once at import instead of on every plot ---
+# Colors for drawing bounding boxes
+_COLORS = tuple([
+    'red', 'green', 'blue', 'yellow', 'orange', 'pink', 'purple', 'brown',
+    'gray', 'beige', 'turquoise', 'cyan', 'magenta', 'lime', 'navy',
+    'maroon', 'teal', 'olive', 'coral', 'lavender', 'violet', 'gold', 'silver'
+] + list(ImageColor.colormap)) # Add more standard colors
+
+# Font for labels
+try:
+    _FONT = ImageFont.truetype("arial.ttf", size=14)
+except IOError:
+    _FONT = ImageFont.load_default() # Fallback if 'arial.ttf' is not found on the system
+    print("WARNING: 'arial.ttf' not found, using default font for bounding boxes.")
+
+
+@functools.lru_cache(maxsize=256)
+def _render_label(label: str) -> Image.Image:
+    """
+    Rasterizes a label once into an "L" mask so recurring labels skip the glyph layout on every frame.
+    The mask is anchored like draw.text at (0, 0), so pasting it at (x, y) matches draw.text((x, y), ...).
+    """
+    _, _, right, bottom = _FONT.getbbox(label)
+    mask = Image.new("L", (max(right, 1), max(bottom, 1)))
+    ImageDraw.Draw(mask).text((0, 0), label, fill=255, font=_FONT)
+    return mask
+
+
+# --- Compiled kernel: normalized [y1, x1, y2, x2] boxes -> absolute [x1, y1, x2, y2] pixels ---
+@njit(cache=True)
+def _convert_bboxes(boxes: np.ndarray, width: int, height: int) -> np.ndarray:
+    abs_boxes = np.empty(boxes.shape, dtype=np.int64)
+    for i in range(boxes.shape[0]):
+        # int() truncates like the original per-box conversion
+        abs_y1 = int(boxes[i, 0] / 1000 * height)
+        abs_x1 = int(boxes[i, 1] / 1000 * width)
+        abs_y2 = int(boxes[i, 2] / 1000 * height)
+        abs_x2 = int(boxes[i, 3] / 1000 * width)
+        # Ensure correct box orientation (min coordinate first)
+        abs_boxes[i, 0] = min(abs_x1, abs_x2)
+        abs_boxes[i, 1] = min(abs_y1, abs_y2)
+        abs_boxes[i, 2] = max(abs_x1, abs_x2)
+        abs_boxes[i, 3] = max(abs_y1, abs_y2)
+    return abs_boxes
+
+
 # --- Plotting Function: Draws bounding boxes on a PIL Image ---
-def plot_bounding_boxes(im: Image.Image, bounding_boxes_json_str: str, output_path: str = None):
+def plot_bounding_boxes(im: Image.Image, bounding_boxes_json_str: str, output_path: str = None, inplace: bool = False):
     """
     Draws bounding boxes and labels on a PIL Image based on Gemini's JSON response.
 
@@ -97,30 +410,18 @@ def plot_bounding_boxes(im: Image.Image, bounding_boxes_json_str: str, output_pa
                                        potentially including markdown fencing.
         output_path (str, optional): If provided, the image with bounding boxes will be saved
                                      to this path (e.g., "output.png"). If None, img.show() is called.
+        inplace (bool, optional): Draw directly on `im` instead of a copy, for callers that don't read
+                                  `im` again. Defaults to False.
     """
-    img = im.copy() # Work on a copy to avoid modifying the original image
+    # Work on a copy to avoid modifying the original image, unless the caller opted out
+    img = im if inplace else im.copy()
     width, height = img.size
-    draw = ImageDraw.Draw(img)
-
-    # Colors for drawing bounding boxes
-    colors = [
-        'red', 'green', 'blue', 'yellow', 'orange', 'pink', 'purple', 'brown',
-        'gray', 'beige', 'turquoise', 'cyan', 'magenta', 'lime', 'navy',
-        'maroon', 'teal', 'olive', 'coral', 'lavender', 'violet', 'gold', 'silver'
-    ] + [colorname for (colorname, colorcode) in ImageColor.colormap.items()] # Add more standard colors
-
-    # Load font for labels
-    try:
-        font = ImageFont.truetype("arial.ttf", size=14)
-    except IOError:
-        font = ImageFont.load_default() # Fallback if 'arial.ttf' is not found on the system
-        print("WARNING: 'arial.ttf' not found, using default font for bounding boxes.")
 
     # Parse the JSON string from Gemini's response
     try:
         # Use parse_json to remove markdown fencing if it exists
         clean_json_str = parse_json(bounding_boxes_json_str)
-        bounding_boxes_list = json.loads(clean_json_str)
+        bounding_boxes_list = json_loads(clean_json_str)
     except json.JSONDecodeError as e:
         print(f"ERROR: Could not parse bounding box JSON: {e}")
         print(f"Received raw JSON string: {bounding_boxes_json_str[:500]}...")
@@ -129,41 +430,46 @@ def plot_bounding_boxes(im: Image.Image, bounding_boxes_json_str: str, output_pa
     # List to hold the new absolute boxes (for optional printing)
     absolute_boxes = []
 
-    # Loop through each detected bounding box
+    # Keep only well-formed boxes, remembering their original index for colors and default labels
+    valid_boxes = []
     for i, bounding_box in enumerate(bounding_boxes_list):
-        color = colors[i % len(colors)] # Cycle through colors
-
         # Ensure 'box_2d' exists and has 4 elements
         if "box_2d" not in bounding_box or len(bounding_box["box_2d"]) != 4:
             print(f"WARNING: Skipping malformed bounding box: {bounding_box}. Expected 'box_2d' with 4 coordinates.")
             continue
+        valid_boxes.append((i, bounding_box))
 
-        # Convert normalized coordinates (0-1000) to absolute pixels
-        # Gemini's coordinates are often 0-1000, as in your original gemini3.py
-        abs_y1 = int(bounding_box["box_2d"][0] / 1000 * height)
-        abs_x1 = int(bounding_box["box_2d"][1] / 1000 * width)
-        abs_y2 = int(bounding_box["box_2d"][2] / 1000 * height)
-        abs_x2 = int(bounding_box["box_2d"][3] / 1000 * width)
+    # Convert normalized coordinates (0-1000) to absolute pixels for all boxes at once
+    # Gemini's coordinates are often 0-1000, as in your original gemini3.py
+    boxes = np.array([bounding_box["box_2d"] for _, bounding_box in valid_boxes], dtype=np.float64).reshape(-1, 4)
+    abs_boxes = _convert_bboxes(boxes, width, height).tolist()
 
-        # Ensure correct box orientation (min coordinate first)
-        if abs_x1 > abs_x2:
-            abs_x1, abs_x2 = abs_x2, abs_x1
-        if abs_y1 > abs_y2:
-            abs_y1, abs_y2 = abs_y2, abs_y1
+    # Draw all boxes in one pass: with aggdraw every rectangle goes into a single anti-grain buffer
+    # that is written back to the image once on flush(); otherwise fall back to PIL
+    box_colors = [_COLORS[i % len(_COLORS)] for i, _ in valid_boxes] # Cycle through colors
+    if aggdraw is not None and img.mode in ("RGB", "RGBA", "L"):
+        agg_draw = aggdraw.Draw(img)
+        for color, abs_box in zip(box_colors, abs_boxes, strict=True):
+            agg_draw.rectangle(abs_box, aggdraw.Pen(ImageColor.getrgb(color), 4))
+        agg_draw.flush()
+    else:
+        draw = ImageDraw.Draw(img)
+        for color, (abs_x1, abs_y1, abs_x2, abs_y2) in zip(box_colors, abs_boxes, strict=True):
+            draw.rectangle(((abs_x1, abs_y1), (abs_x2, abs_y2)), outline=color, width=4)
 
-        # Draw the box
-        draw.rectangle(((abs_x1, abs_y1), (abs_x2, abs_y2)), outline=color, width=4)
+    # Labels go on top of the boxes (after the aggdraw flush, which would overwrite them)
+    for (i, bounding_box), color, abs_box in zip(valid_boxes, box_colors, abs_boxes, strict=True):
+        abs_x1, abs_y1, _, _ = abs_box
 
         # Draw the label if present, otherwise use a generic object_X label
         label = bounding_box.get("label", f"object_{i+1}")
         # Position the text slightly inside the top-left corner
-        draw.text((abs_x1 + 8, abs_y1 + 6), label, fill=color, font=font)
+        img.paste(color, (abs_x1 + 8, abs_y1 + 6), _render_label(label))
 
         # Save the absolute box for optional printing/logging
         absolute_boxes.append({
             "label": label,
-            "abs_box": [abs_x1, abs_y1, abs_x2, abs_y2]
-        
+            "abs_box": abs_box
         })
 
     # Display or save the image
@@ -180,7 +486,7 @@ def plot_bounding_boxes(im: Image.Image, bounding_boxes_json_str: str, output_pa
 
     # Print the absolute bounding boxes as JSON for programmatic use/logging
     print("INFO: Absolute Bounding Boxes (JSON):")
-    print(json.dumps(absolute_boxes))    
+    print(json_dumps(absolute_boxes))    
 
 
 #analyze_image_with_gemini("/home/jony/Downloads/frame_00000.png", "What do you see?") # Example usage
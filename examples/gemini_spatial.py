@@ -1,4 +1,7 @@
+import functools
 import os
+import time
+from collections import OrderedDict
 from google import genai
 from IPython.display import display
 from PIL import Image, ImageColor, ImageDraw, ImageFont
@@ -38,6 +41,44 @@ config = GenerateContentConfig(
     response_schema=list[BoundingBox],
 )
 
+# Colors for the boxes, computed once instead of copying the colormap keys on every plot
+_COLORS = tuple(ImageColor.colormap.keys())
+
+
+@functools.lru_cache(maxsize=16)
+def _font_for(size: int) -> ImageFont.ImageFont:
+    """Default font at the given size; the size only depends on the image dimensions, so it is cached."""
+    return ImageFont.load_default(size=size)
+
+
+# Downloaded images are kept for a few minutes, and only the most recent ones: plotting several prompts on the
+# same URL reuses the download, while a long-lived process neither holds many full-size images nor serves an
+# image that changed behind its URL forever
+IMAGE_CACHE_TTL_S = 300
+IMAGE_CACHE_SIZE = 8
+_image_cache: "OrderedDict[str, tuple[float, Image.Image]]" = OrderedDict()
+
+
+def _fetch_image(image_uri: str) -> Image.Image:
+    """
+    Downloads and decodes the image behind a URL, reusing a copy fetched less than IMAGE_CACHE_TTL_S ago.
+    Callers must copy the returned image before drawing on it.
+    """
+    cached = _image_cache.get(image_uri)
+    if cached is not None and time.monotonic() - cached[0] < IMAGE_CACHE_TTL_S:
+        _image_cache.move_to_end(image_uri)
+        return cached[1]
+
+    with Image.open(requests.get(image_uri, stream=True, timeout=10).raw) as im:
+        im.load()
+        image = im.copy()
+    _image_cache[image_uri] = (time.monotonic(), image)
+    _image_cache.move_to_end(image_uri)
+    if len(_image_cache) > IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
+    return image
+
+
 def plot_bounding_boxes(image_uri: str, bounding_boxes: list[BoundingBox]) -> None:
     """
     Plots bounding boxes on an image with markers for each a name, using PIL, normalized coordinates, and different colors.
@@ -47,15 +88,14 @@ def plot_bounding_boxes(image_uri: str, bounding_boxes: list[BoundingBox]) -> No
         and their positions in normalized [y1 x1 y2 x2] format.
     """
 
-    # Load the image
-    with Image.open(requests.get(image_uri, stream=True, timeout=10).raw) as im:
+    # Load the image (a private copy of the cached download)
+    with _fetch_image(image_uri).copy() as im:
         width, height = im.size
         # Create a drawing object
         draw = ImageDraw.Draw(im)
-        colors = list(ImageColor.colormap.keys())
 
         # Load a font
-        font = ImageFont.load_default(size=int(min(width, height) / 100))
+        font = _font_for(int(min(width, height) / 100))
 
         # Iterate over the bounding boxes
         for i, bbox in enumerate(bounding_boxes):
@@ -67,7 +107,7 @@ def plot_bounding_boxes(image_uri: str, bounding_boxes: list[BoundingBox]) -> No
             abs_x2 = int(x2 / 1000 * width)
 
             # Select a color from the list
-            color = colors[i % len(colors)]
+            color = _COLORS[i % len(_COLORS)]
 
             # Draw the bounding box
             draw.rectangle(((abs_x1, abs_y1), (abs_x2, abs_y2)), outline=color, width=4)
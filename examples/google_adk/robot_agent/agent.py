@@ -1,9 +1,12 @@
+import asyncio
+import logging
 import signal
 import time
-import json
 import io
 import sys
-import torch
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 import google.genai.types as types
@@ -12,19 +15,41 @@ from google.adk.runners import Runner
 from google.adk.artifacts import InMemoryArtifactService 
 from google.adk.sessions import InMemorySessionService
 from google.adk.tools.tool_context import ToolContext
-import examples.teleoperate_so101 as teleoperate_so101
-import examples.gemini_2 as gemini_2
-from examples.gemini_2 import analyze_image_with_gemini, parse_json
 import atexit
-from lerobot.common.utils.utils import (
-    get_safe_torch_device,)
-from lerobot.common.utils.control_utils import predict_action
-from examples import groot_eval_lerobot
+
+logger = logging.getLogger(__name__)
+
+# The robot stack (torch, LeRobot policies, motor and camera drivers) takes seconds to import and connect,
+# so it is loaded by _init_robot on the first tool call instead of at agent startup
+teleoperate_so101 = None
+robot = None
+policy = None
+# Motor names in the order of the policy's action vector
+action_keys = ()
+teleop_device = None
+_init_lock = threading.Lock()
+
+
+def _init_robot():
+    global teleoperate_so101, robot, policy, action_keys, teleop_device
+    with _init_lock:
+        if teleoperate_so101 is not None:
+            return
+        # initialize the robot
+        import examples.teleoperate_so101 as teleop_module
+
+        robot = teleop_module.robot
+        policy = teleop_module.policy
+        action_keys = tuple(robot.action_features)
+        teleop_device = teleop_module.teleop_device
+        teleoperate_so101 = teleop_module
+
 
 def cleanup_and_exit(signum=None, frame=None):
     print("\n[INFO] Disconnecting robot before exit...")
     try:
-        robot.disconnect()
+        if robot is not None:
+            robot.disconnect()
     except Exception as e:
         print(f"[WARNING] Robot disconnect failed: {e}")
     sys.exit(0)
@@ -33,27 +58,78 @@ def cleanup_and_exit(signum=None, frame=None):
 signal.signal(signal.SIGINT, cleanup_and_exit)
 signal.signal(signal.SIGTERM, cleanup_and_exit)
 
-def get_current_inventory() -> dict:
+
+def wait_for_next_tick(next_tick: float, period: float) -> float:
+    """
+    Sleeps until the deadline one `period` after `next_tick` and returns that deadline.
+    Deadlines are absolute, so the loop rate doesn't drift with the time spent in the loop body;
+    if the body overran the deadline we resync to now instead of bursting to catch up.
+    """
+    next_tick += period
+    sleep_s = next_tick - time.perf_counter()
+    if sleep_s > 0:
+        time.sleep(sleep_s)
+    else:
+        next_tick = time.perf_counter()
+    return next_tick
+
+
+# Single worker running Gr00T inference so the next action chunk is computed while the current one executes
+_groot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="groot")
+
+# Cameras used for the inventory, in report order; "head" is required, the others are used when present
+INVENTORY_CAMERAS = ("head", "wrist")
+
+# Hash of the last analyzed camera frames and the inventory result computed from them
+_last_inventory: tuple[int, dict] | None = None
+
+
+def _frames_key(observation: dict, cameras: list[str]) -> int:
+    # In-process only, so the built-in hash is enough
+    return hash(tuple((cam, observation[cam].shape, observation[cam].tobytes()) for cam in cameras))
+
+
+async def get_current_inventory() -> dict:
     """
     Tool function for the agent.
-    Uses the robot head camera and Gemini to return inventory item labels.
+    Uses the robot cameras and Gemini to return inventory item labels.
+    All camera views go to Gemini in a single request, and pixel-identical frames return the previous
+    inventory without calling Gemini.
     """
+    global _last_inventory
     try:
-        observation = robot.get_observation()
+        await asyncio.to_thread(_init_robot)
+        # Already loaded by _init_robot (teleoperate_so101 imports it), so this doesn't block the event loop
+        from examples.gemini_2 import analyze_image_arrays_with_gemini_async, json_loads, parse_json
+
+        # Motor bus and camera reads block, keep them off the event loop so the ADK runner stays responsive
+        observation = await asyncio.to_thread(robot.get_observation)
 
         if "head" not in observation:
             return {"status": "error", "error_message": "No head camera image found."}
+        cameras = [cam for cam in INVENTORY_CAMERAS if cam in observation]
+
+        frame_key = await asyncio.to_thread(_frames_key, observation, cameras)
+        if _last_inventory is not None and _last_inventory[0] == frame_key:
+            return _last_inventory[1]
 
-        image_bytes = teleoperate_so101.image_obs_to_png_bytes(observation["head"])       
-        prompt = "Identify and list all objects in this inventory image that out side the plate. Return only the object labels."
-        response = analyze_image_with_gemini(image_bytes, prompt)
+        prompt = (
+            "These images are views of the same inventory from different cameras. Identify and list all objects "
+            "in them that out side the plate, once each. Return only the object labels."
+        )
+        # One request for all camera views: a single round-trip instead of one per camera
+        response = await analyze_image_arrays_with_gemini_async([observation[cam] for cam in cameras], prompt)
 
         try:
-            parsed_json = json.loads(parse_json(response))
-            labels = [item["label"] for item in parsed_json if "label" in item]
+            parsed_json = json_loads(parse_json(response))
+            # Objects the model still reports from several views are listed once
+            labels = dict.fromkeys(item["label"] for item in parsed_json if "label" in item)
             if not labels:
-                return {"status": "success", "report": "No objects identified in the inventory."}
-            return {"status": "success", "report": f"The inventory contains: {', '.join(labels)}."}
+                result = {"status": "success", "report": "No objects identified in the inventory."}
+            else:
+                result = {"status": "success", "report": f"The inventory contains: {', '.join(labels)}."}
+            _last_inventory = (frame_key, result)
+            return result
         except Exception as e:
             return {"status": "error", "error_message": f"Failed to parse Gemini output: {e}"}
     except Exception as e:
@@ -63,31 +139,43 @@ def get_current_inventory() -> dict:
 async def pick_item(item: str, tool_context: ToolContext) -> dict:
    """Robot pick up the item and put in tray for pickup."""
    
+   await asyncio.to_thread(_init_robot)
    if policy:
+        from lerobot.common.utils.control_utils import predict_action
+        from lerobot.common.utils.utils import get_safe_torch_device
         
         duration = 15 
+        period = 1 / 10
+        # Constant for the whole run, resolved once instead of on every step
+        device = get_safe_torch_device(policy.config.device)
+        use_amp = policy.config.use_amp
+        task = teleoperate_so101.single_task
+        robot_type = robot.robot_type
+        # Compiles and warms up on the first pick only
+        await asyncio.to_thread(teleoperate_so101.compile_policy, policy, robot)
         start = time.perf_counter()
+        next_tick = start
         while True:
             observation = robot.get_observation()
             observation_frame = teleoperate_so101.build_dataset_frame(
             teleoperate_so101.dataset_features, observation, prefix="observation"
             )
-            print("Observation frame:", observation_frame.keys())
             #action_values_from_groot = groot_eval_lerobot.eval(observation_frame)
             #action_from_groot = {key: action_values_from_groot[0][i].item() for i, key in enumerate(robot.action_features)}
             #print("Action from Groot values:", action_values_from_groot[0])
 
-            action_values = predict_action(
-                observation_frame,
-                policy,
-                get_safe_torch_device(policy.config.device),
-                policy.config.use_amp,
-                task=teleoperate_so101.single_task,
-                robot_type=robot.robot_type,
-            )
-            print("Action values:", action_values)
-            action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
-            print("Action values: sent to robot", action)
+            with teleoperate_so101.policy_autocast(device):
+                action_values = predict_action(
+                    observation_frame,
+                    policy,
+                    device,
+                    use_amp,
+                    task=task,
+                    robot_type=robot_type,
+                )
+            # One conversion for the whole vector instead of a .item() call per joint
+            action = dict(zip(action_keys, action_values.tolist(), strict=True))
+            logger.debug("Action sent to robot: %s", action)
             
             
             
@@ -99,11 +187,11 @@ async def pick_item(item: str, tool_context: ToolContext) -> dict:
             robot.send_action(action)
 
             loop_time = time.perf_counter() - start
-            print(f"Policry running at action at {loop_time:.2f}s")
+            logger.debug("Policy running at %.2fs", loop_time)
 
             if duration and time.perf_counter() - start >= duration:
                 break
-            time.sleep(1/10)
+            next_tick = wait_for_next_tick(next_tick, period)
 
    
         
@@ -119,14 +207,14 @@ async def pick_item(item: str, tool_context: ToolContext) -> dict:
         
         #robot.send_action(action)
         observation = robot.get_observation()
-        image_bytes = teleoperate_so101.image_obs_to_png_bytes(observation["head"])
+        image_bytes = teleoperate_so101.image_obs_to_jpeg_bytes(observation["head"])
         image_artifact = types.Part(
             inline_data=types.Blob(
-                mime_type="image/png",
+                mime_type="image/jpeg",
                 data=image_bytes
             )
         )
-        version = await tool_context.save_artifact(filename="inventory.png", artifact=image_artifact)
+        version = await tool_context.save_artifact(filename="inventory.jpg", artifact=image_artifact)
         print(f"INFO: Inventory image saved with version: {version}")
         return {"status": "success", "action_values": "dummy"}
    else:
@@ -136,31 +224,50 @@ async def pick_item(item: str, tool_context: ToolContext) -> dict:
 async def ask_groot_to_pick_item(item: str, tool_context: ToolContext) -> dict:
    """Groot Robot pick up the item and put in tray for pickup."""
    
+   await asyncio.to_thread(_init_robot)
    if policy:
+        from examples import groot_eval_lerobot
         
         duration = 15 
+        period = 1 / 10
+        # Request the next chunk once fewer than this many actions are left to execute
+        refill_below = groot_eval_lerobot.ACTION_HORIZON // 2
+        action_queue = deque()
+        pending = None
+        executed = 0
+        submitted_at = 0
         start = time.perf_counter()
+        next_tick = start
         while True:
-            observation = robot.get_observation()
-            observation_frame = teleoperate_so101.build_dataset_frame(
-            teleoperate_so101.dataset_features, observation, prefix="observation"
-            )
-            print("Observation frame:", observation_frame.keys())
-            action_values_from_groot = groot_eval_lerobot.eval(observation_frame)
-            #action_from_groot = {key: action_values_from_groot[0][i].item() for i, key in enumerate(robot.action_features)}
-            #print("Action from Groot values:", action_values_from_groot[0])
-
-            
-            print("Action values:", action_values_from_groot[0])
-            
-            robot.send_action(action_values_from_groot[0])
+            if pending is None and len(action_queue) < refill_below:
+                observation = robot.get_observation()
+                observation_frame = teleoperate_so101.build_dataset_frame(
+                teleoperate_so101.dataset_features, observation, prefix="observation"
+                )
+                pending = _groot_executor.submit(groot_eval_lerobot.eval, observation_frame)
+                submitted_at = executed
+
+            if pending is not None and (pending.done() or not action_queue):
+                action_chunk = pending.result()
+                pending = None
+                # Actions executed while the chunk was being inferred are already in the past: splice the
+                # new chunk in at the current step and drop whatever is left of the old one.
+                stale = executed - submitted_at
+                action_queue = deque(action_chunk[stale:groot_eval_lerobot.ACTION_HORIZON])
+                logger.debug("Received Groot action chunk, %d actions queued", len(action_queue))
+
+            if action_queue:
+                robot.send_action(action_queue.popleft())
+                executed += 1
 
             loop_time = time.perf_counter() - start
-            print(f"Policry running at action at {loop_time:.2f}s")
+            logger.debug("Policy running at %.2fs", loop_time)
 
             if duration and time.perf_counter() - start >= duration:
                 break
-            time.sleep(1/10)
+            next_tick = wait_for_next_tick(next_tick, period)
+        if pending is not None:
+            pending.cancel()
 
    
         
@@ -176,14 +283,14 @@ async def ask_groot_to_pick_item(item: str, tool_context: ToolContext) -> dict:
         
         #robot.send_action(action)
         observation = robot.get_observation()
-        image_bytes = teleoperate_so101.image_obs_to_png_bytes(observation["head"])
+        image_bytes = teleoperate_so101.image_obs_to_jpeg_bytes(observation["head"])
         image_artifact = types.Part(
             inline_data=types.Blob(
-                mime_type="image/png",
+                mime_type="image/jpeg",
                 data=image_bytes
             )
         )
-        version = await tool_context.save_artifact(filename="inventory.png", artifact=image_artifact)
+        version = await tool_context.save_artifact(filename="inventory.jpg", artifact=image_artifact)
         print(f"INFO: Inventory image saved with version: {version}")
         return {"status": "success", "action_values": "dummy"}
    else:
@@ -201,41 +308,38 @@ async def handoff_to_teleoperator(item: str, tool_context: ToolContext) -> dict:
     Returns:
         dict: status and result or error msg.
     """
+    await asyncio.to_thread(_init_robot)
     # send commadn to robot to pick item.
     fps = 30
     duration = 15 # Frames per second for manual teleoperation
     print("Entering manual teleop loop...")
     start = time.perf_counter()
+    next_tick = start
     while True:
         action = teleop_device.get_action()
-        print(f"[MANUAL] Action received: {action}")
+        logger.debug("[MANUAL] Action received: %s", action)
         robot.send_action(action)
 
         loop_time = time.perf_counter() - start
-        print(f"[MANUAL] Sent zero action at {loop_time:.2f}s")
+        logger.debug("[MANUAL] Sent action at %.2fs", loop_time)
 
         if duration and time.perf_counter() - start >= duration:
             break
-    time.sleep(1 / fps)
+        next_tick = wait_for_next_tick(next_tick, 1 / fps)
     observation = robot.get_observation()
-    image_bytes = teleoperate_so101.image_obs_to_png_bytes(observation["head"])
+    image_bytes = teleoperate_so101.image_obs_to_jpeg_bytes(observation["head"])
     image_artifact = types.Part(
         inline_data=types.Blob(
-            mime_type="image/png",
+            mime_type="image/jpeg",
             data=image_bytes
         )
     )
-    version = await tool_context.save_artifact(filename="inventory.png", artifact=image_artifact)
+    version = await tool_context.save_artifact(filename="inventory.jpg", artifact=image_artifact)
     print(f"INFO: Inventory image saved with version: {version}")
 
     return {"status": "success", "action_values": "dummy"}
     
     
-# initialize the robot
-robot = teleoperate_so101.robot
-policy = teleoperate_so101.policy 
-teleop_device = teleoperate_so101.teleop_device
-
 artifact_service = InMemoryArtifactService()
 session_service = InMemorySessionService()
 
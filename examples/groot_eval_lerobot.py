@@ -42,8 +42,10 @@ python -m lerobot.replay \
 ```
 """
 
+import functools
 import time
 import numpy as np
+from numba import njit
 
 import rerun as rr
 
@@ -60,6 +62,23 @@ from examples.service import ExternalRobotInferenceClient
 #################################################################################
 
 
+@njit(cache=True)
+def _assemble_state(state_in, arm_out, grip_out):
+    """Copy the 6-dof state vector into the batched (1, 5) arm and (1, 1) gripper request buffers."""
+    for i in range(5):
+        arm_out[0, i] = state_in[i]
+    grip_out[0, 0] = state_in[5]
+
+
+@njit(cache=True)
+def _merge_action_chunk(arm_actions, grip_actions, out):
+    """Write the (horizon, 5) arm and (horizon, 1) gripper actions side by side into `out` (horizon, 6)."""
+    for t in range(out.shape[0]):
+        for j in range(5):
+            out[t, j] = arm_actions[t, j]
+        out[t, 5] = grip_actions[t, 0]
+
+
 class Gr00tRobotInferenceClient:
     """The exact keys used is defined in modality.json
 
@@ -83,26 +102,30 @@ class Gr00tRobotInferenceClient:
             len(robot_state_keys) == 6
         ), f"robot_state_keys should be size 6, but got {len(robot_state_keys)} "
         self.modality_keys = ["single_arm", "gripper"]
+        # Request buffers reused across calls, already batched with a history of 1.
+        # They are only read while the request is serialized, so refilling them on the next call is safe.
+        self._state_arm = np.empty((1, 5), dtype=np.float64)
+        self._state_grip = np.empty((1, 1), dtype=np.float64)
+        self._lang = [None]
+        self._obs_dict = {
+            "video.webcam": None,
+            "state.single_arm": self._state_arm,
+            "state.gripper": self._state_grip,
+            "annotation.human.task_description": self._lang,
+        }
+        # (horizon, 6) output of _merge_action_chunk, reallocated only if the horizon changes
+        self._action_buf = np.empty((0, 6), dtype=np.float64)
 
     def get_action(self, observation_dict, lang: str):
-        # first add the images
+        # first add the images, as a batched view of the frame (no copy)
         #obs_dict = {f"video.{key}": observation_dict[key] for key in self.camera_keys}
-        obs_dict = {}
-        obs_dict["video.webcam"] = observation_dict["observation.images.head"]
-        
+        obs_dict = self._obs_dict
+        obs_dict["video.webcam"] = np.asarray(observation_dict["observation.images.head"])[np.newaxis, ...]
 
-        # Make all single float value of dict[str, float] state into a single array
+        # Split the state vector into the preallocated float64 buffers (the copy also does the cast)
         state = observation_dict["observation.state"]                    #np.array([observation_dict[k] for k in self.robot_state_keys])
-        obs_dict["state.single_arm"] = state[:5].astype(np.float64)
-        obs_dict["state.gripper"] = state[5:6].astype(np.float64)
-        obs_dict["annotation.human.task_description"] = lang
-
-        # then add a dummy dimension of np.array([1, ...]) to all the keys (assume history is 1)
-        for k in obs_dict:
-            if isinstance(obs_dict[k], np.ndarray):
-                obs_dict[k] = obs_dict[k][np.newaxis, ...]
-            else:
-                obs_dict[k] = [obs_dict[k]]
+        _assemble_state(np.asarray(state), self._state_arm, self._state_grip)
+        self._lang[0] = lang
 
         # get the action chunk via the policy server
         # Example of obs_dict for single camera task:
@@ -116,63 +139,53 @@ class Gr00tRobotInferenceClient:
         action_chunk = self.policy.get_action(obs_dict)
 
         # convert the action chunk to a list of dict[str, float]
-        lerobot_actions = []
-        for i in range(16):
-            action_dict = self._convert_to_lerobot_action(action_chunk, i)
-            lerobot_actions.append(action_dict)
-        return lerobot_actions
-
-    def _convert_to_lerobot_action(
-        self, action_chunk: dict[str, np.array], idx: int
-    ) -> dict[str, float]:
-        """
-        This is a magic function that converts the action chunk to a dict[str, float]
-        This is because the action chunk is a dict[str, np.array]
-        and we want to convert it to a dict[str, float]
-        so that we can send it to the robot
-        """
-        concat_action = np.concatenate(
-            [np.atleast_1d(action_chunk[f"action.{key}"][idx]) for key in self.modality_keys],
-            axis=0,
-        )
-        assert len(concat_action) == len(self.robot_state_keys), "this should be size 6"
-        # convert the action to dict[str, float]
-        action_dict = {key: concat_action[i] for i, key in enumerate(self.robot_state_keys)}
-        return action_dict
+        # Merge the per-modality arrays into one (horizon, 6) buffer and convert it in a single tolist() call.
+        # The gripper may come back as (horizon,) rather than (horizon, 1), hence the reshape.
+        arm_actions = np.asarray(action_chunk["action.single_arm"])
+        grip_actions = np.asarray(action_chunk["action.gripper"]).reshape(len(arm_actions), -1)
+        assert arm_actions.shape[-1] + grip_actions.shape[-1] == len(self.robot_state_keys), "this should be size 6"
+        if len(self._action_buf) != len(arm_actions):
+            self._action_buf = np.empty((len(arm_actions), 6), dtype=np.float64)
+        full = self._action_buf
+        _merge_action_chunk(arm_actions, grip_actions, full)
+        return [dict(zip(self.robot_state_keys, row, strict=True)) for row in full.tolist()]
 
 
 #################################################################################
 
+# Number of actions from each returned chunk that are executed before the chunk is considered stale
+ACTION_HORIZON = 8
 
+# get camera keys from RobotConfig
+CAMERA_KEYS = ['webcam']
 
-def eval(observation_dict: dict ):
-    
-    
-    action_horizon = 8
-
-    # get camera keys from RobotConfig
-    camera_keys = ['webcam']
-    print("camera_keys: ", camera_keys)
+LANGUAGE_INSTRUCTION = 'Pick the wooden block and put in the plate.'
 
-   
-    language_instruction = 'Pick the wooden block and put in the plate.'
+# NOTE: for so100/so101, this should be:
+# ['shoulder_pan.pos', 'shoulder_lift.pos', 'elbow_flex.pos', 'wrist_flex.pos', 'wrist_roll.pos', 'gripper.pos']
+ROBOT_STATE_KEYS = ['shoulder_pan.pos', 'shoulder_lift.pos', 'elbow_flex.pos', 'wrist_flex.pos', 'wrist_roll.pos', 'gripper.pos']
 
-    # NOTE: for so100/so101, this should be:
-    # ['shoulder_pan.pos', 'shoulder_lift.pos', 'elbow_flex.pos', 'wrist_flex.pos', 'wrist_roll.pos', 'gripper.pos']
-    robot_state_keys = ['shoulder_pan.pos', 'shoulder_lift.pos', 'elbow_flex.pos', 'wrist_flex.pos', 'wrist_roll.pos', 'gripper.pos']
-    print("robot_state_keys: ", robot_state_keys)
 
+@functools.lru_cache(maxsize=1)
+def get_groot_client() -> Gr00tRobotInferenceClient:
+    """The shared policy client, so the ZMQ connection and request buffers are set up once, not per eval() call."""
     # Step 2: Initialize the policy
-    policy = Gr00tRobotInferenceClient(
+    return Gr00tRobotInferenceClient(
         host='192.168.17.87',
         port='5555',
-        camera_keys=camera_keys,
-        robot_state_keys=robot_state_keys,
+        camera_keys=CAMERA_KEYS,
+        robot_state_keys=ROBOT_STATE_KEYS,
     )
+
+
+def eval(observation_dict: dict, lang: str = LANGUAGE_INSTRUCTION):
+    
+    
+    policy = get_groot_client()
     
     # Step 3: Run the Eval Loop
     
-    action_chunk = policy.get_action(observation_dict, language_instruction)
+    action_chunk = policy.get_action(observation_dict, lang)
     return action_chunk
         
         
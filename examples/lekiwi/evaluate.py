@@ -15,6 +15,9 @@ policy = ACTPolicy.from_pretrained("pepijn223/act_lekiwi_circle")
 policy.reset()
 
 obs_features = hw_to_dataset_features(robot.observation_features, "observation")
+action_keys = list(robot.action_features)
+device = get_safe_torch_device(policy.config.device)
+use_amp = policy.config.use_amp
 
 print("Running inference")
 i = 0
@@ -22,10 +25,8 @@ while i < NB_CYCLES_CLIENT_CONNECTION:
     obs = robot.get_observation()
 
     observation_frame = build_dataset_frame(obs_features, obs, prefix="observation")
-    action_values = predict_action(
-        observation_frame, policy, get_safe_torch_device(policy.config.device), policy.config.use_amp
-    )
-    action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
+    action_values = predict_action(observation_frame, policy, device, use_amp)
+    action = dict(zip(action_keys, action_values.tolist(), strict=True))
     robot.send_action(action)
     i += 1
 
@@ -1,6 +1,13 @@
+import time
+
 from lerobot.common.robots.lekiwi import LeKiwiClient, LeKiwiClientConfig
 from lerobot.common.teleoperators.keyboard.teleop_keyboard import KeyboardTeleop, KeyboardTeleopConfig
 from lerobot.common.teleoperators.so100_leader import SO100Leader, SO100LeaderConfig
+from lerobot.common.utils.robot_utils import busy_wait
+
+FPS = 30
+# The observation poll can block for up to the client's polling timeout, so it only runs every few ticks
+OBS_EVERY = 5
 
 robot_config = LeKiwiClientConfig(remote_ip="172.18.134.136", id="my_lekiwi")
 
@@ -20,13 +27,26 @@ robot.connect()
 teleop_arm.connect()
 telep_keyboard.connect()
 
+# Ticks are scheduled against absolute deadlines so a slow iteration doesn't push back every later one
+period = 1 / FPS
+next_deadline = time.perf_counter() + period
+tick = 0
+# The action keys are fixed, so the prefixed names and the action dict are built once and updated in place.
+# send_action serializes the action right away, so reusing the dict between ticks is safe.
+arm_keys = {key: f"arm_{key}" for key in teleop_arm.action_features}
+action = {}
 while True:
-    observation = robot.get_observation()
+    if tick % OBS_EVERY == 0:
+        observation = robot.get_observation()
+    tick += 1
 
-    arm_action = teleop_arm.get_action()
-    arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
+    for key, value in teleop_arm.get_action().items():
+        action[arm_keys[key]] = value
 
     keyboard_keys = telep_keyboard.get_action()
-    base_action = robot._from_keyboard_to_base_action(keyboard_keys)
+    action.update(robot._from_keyboard_to_base_action(keyboard_keys))
+
+    robot.send_action(action)
 
-    robot.send_action(arm_action | base_action)
+    busy_wait(next_deadline - time.perf_counter())
+    next_deadline = max(next_deadline + period, time.perf_counter())
@@ -10,8 +10,6 @@ import examples.teleoperate_so101 as teleoperate_so101
 import examples.gemini_2 as gemini_2
 from examples.gemini_2 import analyze_image_with_gemini, parse_json
 import atexit
-from lerobot.common.utils.utils import (
-    get_safe_torch_device,)
 from lerobot.common.utils.control_utils import predict_action
 
 def cleanup_and_exit(signum=None, frame=None):
@@ -37,9 +35,9 @@ def get_current_inventory() -> dict:
         if "head" not in observation:
             return {"status": "error", "error_message": "No head camera image found."}
 
-        image_bytes = teleoperate_so101.image_obs_to_png_bytes(observation["head"])
+        image_bytes = teleoperate_so101.image_obs_to_jpeg_bytes(observation["head"])
         prompt = "Identify and list all objects in this inventory image. Return only the object labels."
-        response = analyze_image_with_gemini(image_bytes, prompt)
+        response = analyze_image_with_gemini(image_bytes, prompt, mime_type="image/jpeg")
 
         try:
             parsed_json = json.loads(parse_json(response))
@@ -57,6 +55,8 @@ def pick_item(item: str) -> dict:
    """Robot pick up the item and put in tray for pickup."""
    
    if policy:
+        # Compiles and warms up on the first pick only
+        teleoperate_so101.compile_policy(policy, robot)
         observation = robot.get_observation()
         observation_frame = teleoperate_so101.build_dataset_frame(
             teleoperate_so101.dataset_features, observation, prefix="observation"
@@ -66,7 +66,7 @@ def pick_item(item: str) -> dict:
         action_values = predict_action(
             observation_frame,
             policy,
-            get_safe_torch_device(policy.config.device),
+            policy_device,
             policy.config.use_amp,
             task=teleoperate_so101.single_task,
             robot_type=robot.robot_type,
@@ -111,6 +111,7 @@ def handoff_to_teleoperator(item: str) -> dict:
 # initialize the robot
 robot = teleoperate_so101.robot
 policy = teleoperate_so101.policy 
+policy_device = teleoperate_so101.policy_device
 
 
 root_agent = Agent(
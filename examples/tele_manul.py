@@ -1,58 +1,64 @@
 import logging
+import threading
 import time
-import io
 from PIL import Image
-import numpy as np
-import torch
 from dataclasses import asdict
 from pprint import pformat
 from pathlib import Path
 from lerobot.common.teleoperators.so101_leader import SO101LeaderConfig, SO101Leader
 from lerobot.common.datasets.lerobot_dataset import LeRobotDatasetMetadata
 from lerobot.common.datasets.utils import hw_to_dataset_features
+from lerobot.common.utils.robot_utils import busy_wait
 from lerobot.common.utils.utils import get_safe_torch_device, init_logging, log_say
 from lerobot.common.robots.so101_follower import SO101Follower, SO101FollowerConfig
 from lerobot.common.policies.factory import make_policy
 from lerobot.configs.policies import PreTrainedConfig
 from lerobot.common.cameras.opencv.configuration_opencv import OpenCVCameraConfig
 
-from gemini_2 import analyze_image_with_gemini, plot_bounding_boxes
+from gemini_2 import analyze_image_array_with_gemini, image_obs_to_hwc_uint8, plot_bounding_boxes
 
 
-def image_obs_to_png_bytes(image_obs):
-    if isinstance(image_obs, torch.Tensor):
-        image_obs = image_obs.cpu().numpy()
-    if isinstance(image_obs, np.ndarray):
-        if image_obs.dtype != np.uint8:
-            image_obs = (255 * np.clip(image_obs, 0, 1)).astype(np.uint8)
-        if image_obs.shape[0] in [1, 3] and image_obs.ndim == 3:
-            image_obs = np.transpose(image_obs, (1, 2, 0))
-        img = Image.fromarray(image_obs)
-    elif isinstance(image_obs, Image.Image):
-        img = image_obs
-    else:
-        raise ValueError("Unsupported image type")
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return buf.getvalue()
+def analyze_and_plot(image_obs):
+    """Asks Gemini for bounding boxes on an image observation and plots them."""
+    try:
+        frame = image_obs_to_hwc_uint8(image_obs)
+        img = Image.fromarray(frame)
+        gemini_prompt = "Identify and return bounding boxes for all objects in this image. Provide a summary."
+
+        print("INFO: Calling Gemini API...")
+        # Looked up by the raw pixels first: an unchanged frame reuses the cached answer, with no encode or call
+        gemini_response_text = analyze_image_array_with_gemini(frame, gemini_prompt)
+        print(f"Gemini Raw Response: {gemini_response_text[:500]}...")
+
+        try:
+            # img is built just for this plot and not used again, so the boxes are drawn on it directly
+            plot_bounding_boxes(img, gemini_response_text, inplace=True)
+        except Exception as plot_e:
+            print(f"Error plotting boxes: {plot_e}")
 
+    except Exception as e:
+        print(f"Gemini image handling error: {e}")
 
 
 def manual_teleop_loop(robot, teleop, fps=30, duration=None):
     print("Entering manual teleop loop...")
     start = time.perf_counter()
+    # Absolute deadlines, so the time spent reading and sending doesn't stretch the period
+    period = 1 / fps
+    next_deadline = start + period
     try:
         while True:
             action = teleop_device.get_action()
             robot.send_action(action)
 
-            loop_time = time.perf_counter() - start
-            print(f"[MANUAL] Sent zero action at {loop_time:.2f}s")
+            # No print per step, writing to the terminal at the control rate slows the loop down.
+            # Lazy %-formatting, so the message is only built when debug logging is on.
+            logging.debug("[MANUAL] Sent action at %.2fs", time.perf_counter() - start)
 
             if duration and time.perf_counter() - start >= duration:
                 break
-            time.sleep(1 / fps)
+            busy_wait(next_deadline - time.perf_counter())
+            next_deadline = max(next_deadline + period, time.perf_counter())
     except KeyboardInterrupt:
         print("Manual loop interrupted.")
     finally:
@@ -97,27 +103,18 @@ while i < 1:
     observation = robot.get_observation()
     print("Observation keys:", list(observation.keys()))
 
+    gemini_thread = None
     if 'head' in observation:
-        try:
-            png_bytes = image_obs_to_png_bytes(observation["head"])
-            img = Image.open(io.BytesIO(png_bytes))
-            gemini_prompt = "Identify and return bounding boxes for all objects in this image. Provide a summary."
-
-            print("INFO: Calling Gemini API...")
-            gemini_response_text = analyze_image_with_gemini(png_bytes, gemini_prompt)
-            print(f"Gemini Raw Response: {gemini_response_text[:500]}...")
-
-            try:
-                plot_bounding_boxes(img, gemini_response_text)
-            except Exception as plot_e:
-                print(f"Error plotting boxes: {plot_e}")
-
-        except Exception as e:
-            print(f"Gemini image handling error: {e}")
+        # The Gemini round-trip takes hundreds of ms or more, so it runs in the background and teleoperation
+        # starts right away instead of waiting for the boxes
+        gemini_thread = threading.Thread(target=analyze_and_plot, args=(observation["head"],), daemon=True)
+        gemini_thread.start()
     else:
         print("No image data in observation.")
 
     manual_teleop_loop(robot, teleop, fps=30, duration=30)
+    if gemini_thread is not None:
+        gemini_thread.join()
     break
 
 log_say("Stop recording", True, blocking=True)
@@ -1,6 +1,6 @@
 import logging
 import time
-import io
+from contextlib import nullcontext
 from PIL import Image
 import numpy as np
 import torch
@@ -30,37 +30,47 @@ from lerobot.common.utils.utils import (
 #NEW IMPORTS FOR IMAGE CONVERSION AND GEMINI API CALL
 import cv2
 import numpy as np
-import io # Import io for handling bytes in memory
 import json # For parsing Gemini's JSON response if needed
 from PIL import Image # NEW: Import PIL.Image to convert NumPy array to PIL Image for plotting
-from examples. gemini_2 import analyze_image_with_gemini, parse_json, plot_bounding_boxes 
+from examples. gemini_2 import analyze_image_with_gemini, encode_rgb_jpeg, image_obs_to_hwc_uint8, parse_json, plot_bounding_boxes 
 
 
 
-def image_obs_to_png_bytes(image_obs):
+def image_obs_to_png_bytes(image_obs, compression=1):
     """
     Convert an image observation (numpy array, torch tensor, or PIL Image) to PNG bytes.
+    For when the image must be lossless; uploads to Gemini should use image_obs_to_jpeg_bytes instead.
+    Encoded with OpenCV at a low zlib `compression` level (0-9), much faster than PIL's default of 6.
     """
-    # Convert to numpy if needed
-    if isinstance(image_obs, torch.Tensor):
-        image_obs = image_obs.cpu().numpy()
-    if isinstance(image_obs, np.ndarray):
-        # Ensure uint8 and channel order
-        if image_obs.dtype != np.uint8:
-            image_obs = (255 * np.clip(image_obs, 0, 1)).astype(np.uint8)
-        if image_obs.shape[0] in [1, 3] and image_obs.ndim == 3:
-            # Convert CHW to HWC
-            image_obs = np.transpose(image_obs, (1, 2, 0))
-        img = Image.fromarray(image_obs)
-    elif isinstance(image_obs, Image.Image):
-        img = image_obs
+    if isinstance(image_obs, Image.Image):
+        image_obs = np.asarray(image_obs.convert("RGB"))
     else:
-        raise ValueError("Unsupported image type")
+        image_obs = image_obs_to_hwc_uint8(image_obs)
+    if image_obs.ndim == 3 and image_obs.shape[2] == 3:
+        # OpenCV encodes BGR, camera observations are RGB
+        image_obs = cv2.cvtColor(image_obs, cv2.COLOR_RGB2BGR)
+    ok, buf = cv2.imencode(".png", image_obs, [cv2.IMWRITE_PNG_COMPRESSION, compression])
+    if not ok:
+        raise ValueError("PNG encoding failed")
+    return buf.tobytes()
 
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return buf.getvalue()
+
+def image_obs_to_jpeg_bytes(image_obs, quality=85):
+    """
+    Convert an RGB image observation (numpy array, torch tensor, or PIL Image) to JPEG bytes.
+    Preferred over PNG for uploads to Gemini: libjpeg-turbo encodes much faster than zlib and the
+    payload is several times smaller for natural camera frames.
+    """
+    if isinstance(image_obs, Image.Image):
+        image_obs = np.asarray(image_obs.convert("RGB"))
+    else:
+        image_obs = image_obs_to_hwc_uint8(image_obs)
+    if image_obs.ndim == 3 and image_obs.shape[2] == 3:
+        return encode_rgb_jpeg(image_obs, quality)
+    ok, buf = cv2.imencode(".jpg", image_obs, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    return buf.tobytes()
 
 
 
@@ -81,6 +91,10 @@ teleop_config = SO101LeaderConfig(
 
 single_task = "pick the wooden block and put it in the plate"
 
+# Inference precision for the policy: "fp32" (as configured), "bf16" / "fp16" (CUDA autocast),
+# or "int8" (dynamic weight quantization of the Linear layers, CPU only)
+policy_precision = "fp32"
+
 policy_path = "/home/jony/Downloads/act_so101_test_new2/checkpoints/last/pretrained_model"
 policy_config = PreTrainedConfig.from_pretrained(policy_path)
 print("Policy config:", pformat(asdict(policy_config)))
@@ -97,6 +111,68 @@ action_features = hw_to_dataset_features(robot.action_features, "action", True)
 obs_features = hw_to_dataset_features(robot.observation_features, "observation", True)
 dataset_features = {**action_features, **obs_features}
 
+
+_AUTOCAST_DTYPES = {"bf16": torch.bfloat16, "fp16": torch.float16}
+
+
+def apply_policy_precision(policy, precision):
+    """Prepare the policy for inference at `precision`, see `policy_precision`."""
+    device = get_safe_torch_device(policy.config.device)
+    if precision == "int8":
+        if device.type != "cpu":
+            raise ValueError(f"int8 dynamic quantization is only supported on CPU, not {device.type}")
+        policy.model = torch.ao.quantization.quantize_dynamic(policy.model, {torch.nn.Linear}, dtype=torch.qint8)
+    elif precision in _AUTOCAST_DTYPES:
+        if device.type != "cuda":
+            raise ValueError(f"{precision} autocast is only supported on CUDA, not {device.type}")
+        # policy_autocast takes over, predict_action's own fp16 autocast would override the requested dtype
+        policy.config.use_amp = False
+    elif precision != "fp32":
+        raise ValueError(f"Unsupported policy precision: {precision}")
+
+
+def policy_autocast(device):
+    """Autocast context for `policy_precision`, a no-op unless a reduced precision is requested on CUDA."""
+    dtype = _AUTOCAST_DTYPES.get(policy_precision)
+    if dtype is None or device.type != "cuda":
+        return nullcontext()
+    return torch.autocast(device_type="cuda", dtype=dtype)
+
+
+def compile_policy(policy, robot, warmup_steps=3):
+    """
+    Compile the policy network with torch.compile and run a few warm-up steps on live observations,
+    so the first control step doesn't pay for tracing and CUDA graph capture.
+    Only done on CUDA, where "reduce-overhead" mode can capture CUDA graphs.
+    Not run at import: callers invoke it right before their first control step, later calls are no-ops.
+    """
+    device = get_safe_torch_device(policy.config.device)
+    model = getattr(policy, "model", None)
+    if device.type != "cuda" or model is None or hasattr(model, "_orig_mod"):
+        return
+    policy.model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+    for _ in range(warmup_steps):
+        observation_frame = build_dataset_frame(
+            dataset_features, robot.get_observation(), prefix="observation"
+        )
+        with policy_autocast(device):
+            predict_action(
+                observation_frame,
+                policy,
+                device,
+                policy.config.use_amp,
+                task=single_task,
+                robot_type=robot.robot_type,
+            )
+        # Warm-up actions must not be replayed from the policy's action queue
+        policy.reset()
+
+
+apply_policy_precision(policy, policy_precision)
+
+# Resolved once so per-step inference callers don't redo the device lookup
+policy_device = get_safe_torch_device(policy.config.device) if policy else None
+
 # Optional inventory summary output for agent use
      
 teleop_device = SO101Leader(teleop_config)
@@ -111,6 +111,8 @@ class OpenCVCamera(Camera):
         self.fps = config.fps
         self.color_mode = config.color_mode
         self.warmup_s = config.warmup_s
+        self.fourcc = config.fourcc
+        self.buffer_size = config.buffer_size
 
         self.videocapture: cv2.VideoCapture | None = None
 
@@ -196,6 +198,15 @@ class OpenCVCamera(Camera):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"Cannot configure settings for {self} as it is not connected.")
 
+        # The pixel format constrains the available resolutions and frame rates, so it goes first
+        if self.fourcc is not None:
+            self._validate_fourcc()
+
+        if self.buffer_size is not None and not self.videocapture.set(
+            cv2.CAP_PROP_BUFFERSIZE, float(self.buffer_size)
+        ):
+            logger.debug(f"{self} backend ignored buffer_size={self.buffer_size}.")
+
         if self.fps is None:
             self.fps = self.videocapture.get(cv2.CAP_PROP_FPS)
         else:
@@ -213,6 +224,15 @@ class OpenCVCamera(Camera):
         else:
             self._validate_width_and_height()
 
+    def _validate_fourcc(self) -> None:
+        """Validates and sets the camera's pixel format."""
+
+        success = self.videocapture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        actual_code = int(self.videocapture.get(cv2.CAP_PROP_FOURCC))
+        actual_fourcc = actual_code.to_bytes(4, "little").decode(errors="replace")
+        if not success or actual_fourcc != self.fourcc:
+            raise RuntimeError(f"{self} failed to set fourcc={self.fourcc} ({actual_fourcc=}).")
+
     def _validate_fps(self) -> None:
         """Validates and sets the camera's frames per second (FPS)."""
 
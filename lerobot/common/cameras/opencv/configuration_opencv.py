@@ -35,6 +35,7 @@ class OpenCVCameraConfig(CameraConfig):
 
     # Advanced configurations
     OpenCVCameraConfig(128422271347, 30, 640, 480, rotation=Cv2Rotation.ROTATE_90)     # With 90° rotation
+    OpenCVCameraConfig(0, 30, 1280, 720, fourcc="MJPG")   # Compressed stream, less USB bandwidth
     ```
 
     Attributes:
@@ -46,6 +47,10 @@ class OpenCVCameraConfig(CameraConfig):
         color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
+        fourcc: Four-character code of the pixel format to request from the camera (e.g. "MJPG").
+                Defaults to None, keeping the camera's default format.
+        buffer_size: Number of frames the capture backend may queue. Defaults to 1 so reads return the
+                     newest frame instead of a stale one. Best-effort, not every backend supports it.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
@@ -55,6 +60,8 @@ class OpenCVCameraConfig(CameraConfig):
     color_mode: ColorMode = ColorMode.RGB
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
+    fourcc: str | None = None
+    buffer_size: int | None = 1
 
     def __post_init__(self):
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -71,3 +78,6 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`rotation` is expected to be in {(Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90, Cv2Rotation.ROTATE_180, Cv2Rotation.ROTATE_270)}, but {self.rotation} is provided."
             )
+
+        if self.fourcc is not None and len(self.fourcc) != 4:
+            raise ValueError(f"`fourcc` is expected to be 4 characters long, but {self.fourcc} is provided.")
@@ -16,7 +16,7 @@
 
 import logging
 import time
-from functools import cached_property
+from functools import cache, cached_property
 from itertools import chain
 from typing import Any
 
@@ -37,6 +37,24 @@ from .config_lekiwi import LeKiwiConfig
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _base_kinematics(base_radius: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the kinematic matrix mapping body velocities [x, y, theta_rad] to each wheel's linear speed, and
+    its inverse. They only depend on the base geometry, so they are built once instead of on every command.
+    """
+    # Define the wheel mounting angles with a -90° offset.
+    angles = np.radians(np.array([240, 0, 120]) - 90)
+    # Build the kinematic matrix: each row maps body velocities to a wheel’s linear speed.
+    # The third column (base_radius) accounts for the effect of rotation.
+    m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
+    m_inv = np.linalg.inv(m)
+    # Shared between calls, so make sure nobody modifies them in place
+    m.flags.writeable = False
+    m_inv.flags.writeable = False
+    return m, m_inv
+
+
 class LeKiwi(Robot):
     """
     The robot includes a three omniwheel mobile base and a remote follower arm.
@@ -199,11 +217,7 @@ class LeKiwi(Robot):
         speed_in_steps = degps * steps_per_deg
         speed_int = int(round(speed_in_steps))
         # Cap the value to fit within signed 16-bit range (-32768 to 32767)
-        if speed_int > 0x7FFF:
-            speed_int = 0x7FFF  # 32767 -> maximum positive value
-        elif speed_int < -0x8000:
-            speed_int = -0x8000  # -32768 -> minimum negative value
-        return speed_int
+        return min(0x7FFF, max(-0x8000, speed_int))
 
     @staticmethod
     def _raw_to_degps(raw_speed: int) -> float:
@@ -247,11 +261,7 @@ class LeKiwi(Robot):
         # Create the body velocity vector [x, y, theta_rad].
         velocity_vector = np.array([x, y, theta_rad])
 
-        # Define the wheel mounting angles with a -90° offset.
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        # Build the kinematic matrix: each row maps body velocities to a wheel’s linear speed.
-        # The third column (base_radius) accounts for the effect of rotation.
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
+        m, _ = _base_kinematics(base_radius)
 
         # Compute each wheel’s linear speed (m/s) and then its angular speed (rad/s).
         wheel_linear_speeds = m.dot(velocity_vector)
@@ -262,8 +272,7 @@ class LeKiwi(Robot):
 
         # Scaling
         steps_per_deg = 4096.0 / 360.0
-        raw_floats = [abs(degps) * steps_per_deg for degps in wheel_degps]
-        max_raw_computed = max(raw_floats)
+        max_raw_computed = np.abs(wheel_degps).max() * steps_per_deg
         if max_raw_computed > max_raw:
             scale = max_raw / max_raw_computed
             wheel_degps = wheel_degps * scale
@@ -311,12 +320,8 @@ class LeKiwi(Robot):
         # Compute each wheel’s linear speed (m/s) from its angular speed.
         wheel_linear_speeds = wheel_radps * wheel_radius
 
-        # Define the wheel mounting angles with a -90° offset.
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-
         # Solve the inverse kinematics: body_velocity = M⁻¹ · wheel_linear_speeds.
-        m_inv = np.linalg.inv(m)
+        _, m_inv = _base_kinematics(base_radius)
         velocity_vector = m_inv.dot(wheel_linear_speeds)
         x, y, theta_rad = velocity_vector
         theta = theta_rad * (180.0 / np.pi)
@@ -53,6 +53,7 @@ class LeKiwiClient(Robot):
         self.zmq_context = None
         self.zmq_cmd_socket = None
         self.zmq_observation_socket = None
+        self.zmq_observation_poller = None
 
         self.last_frames = {}
 
@@ -129,9 +130,10 @@ class LeKiwiClient(Robot):
         self.zmq_observation_socket.connect(zmq_observations_locator)
         self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
 
-        poller = zmq.Poller()
-        poller.register(self.zmq_observation_socket, zmq.POLLIN)
-        socks = dict(poller.poll(self.connect_timeout_s * 1000))
+        # Registered once and reused by every observation poll
+        self.zmq_observation_poller = zmq.Poller()
+        self.zmq_observation_poller.register(self.zmq_observation_socket, zmq.POLLIN)
+        socks = dict(self.zmq_observation_poller.poll(self.connect_timeout_s * 1000))
         if self.zmq_observation_socket not in socks or socks[self.zmq_observation_socket] != zmq.POLLIN:
             raise DeviceNotConnectedError("Timeout waiting for LeKiwi Host to connect expired.")
 
@@ -142,11 +144,8 @@ class LeKiwiClient(Robot):
 
     def _poll_and_get_latest_message(self) -> Optional[str]:
         """Polls the ZMQ socket for a limited time and returns the latest message string."""
-        poller = zmq.Poller()
-        poller.register(self.zmq_observation_socket, zmq.POLLIN)
-
         try:
-            socks = dict(poller.poll(self.polling_timeout_ms))
+            socks = dict(self.zmq_observation_poller.poll(self.polling_timeout_ms))
         except zmq.ZMQError as e:
             logging.error(f"ZMQ polling error: {e}")
             return None
@@ -339,4 +338,5 @@ class LeKiwiClient(Robot):
         self.zmq_observation_socket.close()
         self.zmq_cmd_socket.close()
         self.zmq_context.term()
+        self.zmq_observation_poller = None
         self._is_connected = False
@@ -15,8 +15,11 @@
 # limitations under the License.
 
 import base64
+import contextlib
 import json
 import logging
+import queue
+import threading
 import time
 
 import cv2
@@ -47,6 +50,38 @@ class LeKiwiHost:
         self.zmq_context.term()
 
 
+def publish_observations(
+    host: LeKiwiHost, camera_keys: tuple[str, ...], obs_queue: queue.Queue, stop_event: threading.Event
+):
+    """
+    Encodes and sends observations off the control loop thread, so JPEG encoding doesn't delay robot I/O.
+    A failed observation is logged and skipped, so the host never silently stops publishing.
+    """
+    while not stop_event.is_set():
+        try:
+            last_observation = obs_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        try:
+            # Encode ndarrays to base64 strings
+            for cam_key in camera_keys:
+                ret, buffer = cv2.imencode(
+                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
+                )
+                if ret:
+                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
+                else:
+                    last_observation[cam_key] = ""
+
+            # Send the observation to the remote agent
+            host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
+        except zmq.Again:
+            logging.info("Dropping observation, no client connected")
+        except Exception as e:
+            logging.error("Observation publishing failed: %s", e)
+
+
 def main():
     logging.info("Configuring LeKiwi")
     robot_config = LeKiwiConfig()
@@ -59,6 +94,16 @@ def main():
     host_config = LeKiwiHostConfig()
     host = LeKiwiHost(host_config)
 
+    # Holds only the newest observation: like the CONFLATE sockets, a fresh one replaces any not yet sent
+    obs_queue = queue.Queue(maxsize=1)
+    stop_event = threading.Event()
+    publisher = threading.Thread(
+        target=publish_observations,
+        args=(host, tuple(robot.cameras), obs_queue, stop_event),
+        daemon=True,
+    )
+    publisher.start()
+
     last_cmd_time = time.time()
     watchdog_active = False
     logging.info("Waiting for commands...")
@@ -90,21 +135,10 @@ def main():
 
             last_observation = robot.get_observation()
 
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
-                if ret:
-                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
-                else:
-                    last_observation[cam_key] = ""
-
-            # Send the observation to the remote agent
-            try:
-                host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
-            except zmq.Again:
-                logging.info("Dropping observation, no client connected")
+            # Hand the observation over to the publisher thread, replacing one it hasn't picked up yet
+            with contextlib.suppress(queue.Empty):
+                obs_queue.get_nowait()
+            obs_queue.put_nowait(last_observation)
 
             # Ensure a short sleep to avoid overloading the CPU.
             elapsed = time.time() - loop_start_time
@@ -117,6 +151,8 @@ def main():
         print("Keyboard interrupt received. Exiting...")
     finally:
         print("Shutting down Lekiwi Host.")
+        stop_event.set()
+        publisher.join()
         robot.disconnect()
         host.disconnect()
 
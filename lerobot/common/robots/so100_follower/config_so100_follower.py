@@ -38,6 +38,11 @@ class SO100FollowerConfig(RobotConfig):
     # Set to `True` for backward compatibility with previous policies/dataset
     use_degrees: bool = False
 
+    # Unchanged goal positions are not written to the bus again, except once every `goal_refresh_every` actions:
+    # sync_write is not acknowledged, so a lost packet would otherwise leave the arm short of its goal for as long
+    # as the leader stays still.
+    goal_refresh_every: int = 10
+
 
 @RobotConfig.register_subclass("so100_follower_end_effector")
 @dataclass
@@ -45,6 +45,9 @@ class SO101Follower(Robot):
     def __init__(self, config: SO101FollowerConfig):
         super().__init__(config)
         self.config = config
+        # Last goal written to the bus, so unchanged goals (e.g. an idle leader arm) aren't sent again
+        self._last_goal_pos: dict[str, float] | None = None
+        self._goal_writes_skipped = 0
         norm_mode_body = MotorNormMode.DEGREES if config.use_degrees else MotorNormMode.RANGE_M100_100
         self.bus = FeetechMotorsBus(
             port=self.config.port,
@@ -91,6 +94,8 @@ class SO101Follower(Robot):
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
         self.bus.connect()
+        self._last_goal_pos = None
+        self._goal_writes_skipped = 0
         if not self.is_calibrated and calibrate:
             self.calibrate()
 
@@ -195,8 +200,14 @@ class SO101Follower(Robot):
             goal_present_pos = {key: (g_pos, present_pos[key]) for key, g_pos in goal_pos.items()}
             goal_pos = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
 
-        # Send goal position to the arm
-        self.bus.sync_write("Goal_Position", goal_pos)
+        # Send goal position to the arm. The servos hold their last goal, so an unchanged one is only resent
+        # periodically, in case an earlier (unacknowledged) write was lost.
+        if goal_pos != self._last_goal_pos or self._goal_writes_skipped >= self.config.goal_refresh_every:
+            self.bus.sync_write("Goal_Position", goal_pos)
+            self._last_goal_pos = goal_pos
+            self._goal_writes_skipped = 0
+        else:
+            self._goal_writes_skipped += 1
         return {f"{motor}.pos": val for motor, val in goal_pos.items()}
 
     def disconnect(self):
@@ -22,7 +22,7 @@ def encode_sign_magnitude(value: int, sign_bit_index: int):
     if magnitude > max_magnitude:
         raise ValueError(f"Magnitude {magnitude} exceeds {max_magnitude} (max for {sign_bit_index=})")
 
-    direction_bit = 1 if value < 0 else 0
+    direction_bit = int(value < 0)
     return (direction_bit << sign_bit_index) | magnitude
 
 
@@ -33,7 +33,8 @@ def decode_sign_magnitude(encoded_value: int, sign_bit_index: int):
     direction_bit = (encoded_value >> sign_bit_index) & 1
     magnitude_mask = (1 << sign_bit_index) - 1
     magnitude = encoded_value & magnitude_mask
-    return -magnitude if direction_bit else magnitude
+    # Direction bit 0 -> +1, 1 -> -1
+    return magnitude * (1 - 2 * direction_bit)
 
 
 def encode_twos_complement(value: int, n_bytes: int):
@@ -50,18 +51,14 @@ def encode_twos_complement(value: int, n_bytes: int):
             f"Value {value} out of range for {n_bytes}-byte two's complement: [{min_val}, {max_val}]"
         )
 
-    if value >= 0:
-        return value
-
-    return (1 << bit_width) + value
+    # Masking to the bit width maps negatives to their complement and leaves non-negatives as is
+    return value & ((1 << bit_width) - 1)
 
 
 def decode_twos_complement(value: int, n_bytes: int) -> int:
     """
     https://en.wikipedia.org/wiki/Signed_number_representations#Two%27s_complement
     """
-    bits = n_bytes * 8
-    sign_bit = 1 << (bits - 1)
-    if value & sign_bit:
-        value -= 1 << bits
-    return value
+    sign_bit = 1 << (n_bytes * 8 - 1)
+    # Flipping the sign bit then subtracting its weight sign-extends without branching
+    return (value ^ sign_bit) - sign_bit
@@ -15,13 +15,18 @@
 import platform
 import time
 
+# Final stretch of a wait that is spun instead of slept on Mac, enough to absorb `time.sleep` overshoot
+SPIN_TAIL_S = 1e-3
+
 
 def busy_wait(seconds):
     if platform.system() == "Darwin":
         # On Mac, `time.sleep` is not accurate and we need to use this while loop trick,
-        # but it consumes CPU cycles.
+        # but it consumes CPU cycles. So we sleep through most of the wait and only spin the tail.
         # TODO(rcadene): find an alternative: from python 11, time.sleep is precise
         end_time = time.perf_counter() + seconds
+        if seconds > 2 * SPIN_TAIL_S:
+            time.sleep(seconds - SPIN_TAIL_S)
         while time.perf_counter() < end_time:
             pass
     else:
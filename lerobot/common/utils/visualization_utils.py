@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import os
+import time
 
+import numpy as np
 import rerun as rr
 
 
@@ -24,3 +26,110 @@ def _init_rerun(session_name: str = "lerobot_control_loop") -> None:
     rr.init(session_name)
     memory_limit = os.getenv("LEROBOT_RERUN_MEMORY_LIMIT", "10%")
     rr.spawn(memory_limit=memory_limit)
+
+
+def make_rerun_log_schema(observation: dict, action: dict, sep: str = ".") -> list[tuple[str, str, str, str]]:
+    """
+    Resolves once how each observation and action value is logged to rerun, so control loops don't have to
+    type-check every value on every step.
+
+    Returns (source, key, entity path, kind) tuples where source is "observation" or "action" and kind is
+    "scalar" or "image". Float values are scalars, numpy arrays are images (observations only), anything else
+    is not logged.
+    """
+    schema = []
+    for key, val in observation.items():
+        if isinstance(val, float):
+            schema.append(("observation", key, f"observation{sep}{key}", "scalar"))
+        elif isinstance(val, np.ndarray):
+            schema.append(("observation", key, f"observation{sep}{key}", "image"))
+    for key, val in action.items():
+        if isinstance(val, float):
+            schema.append(("action", key, f"action{sep}{key}", "scalar"))
+    return schema
+
+
+class RerunScalarBatcher:
+    """
+    Accumulates scalar samples and sends them to rerun as columns, one `rr.send_columns` call per entity per
+    flush instead of one `rr.log` call per entity per control step.
+
+    Every sample must carry the same entities, which holds for values selected by a fixed log schema.
+    """
+
+    def __init__(self, timeline: str = "robot", flush_period_s: float = 0.1, max_samples: int = 100):
+        self.timeline = timeline
+        self.flush_period_s = flush_period_s
+        self.max_samples = max_samples
+        self._times: list[float] = []
+        self._values: dict[str, list[float]] = {}
+        self._last_flush = time.perf_counter()
+
+    def add(self, t: float, values: dict[str, float]) -> None:
+        """Adds the scalars of one step at time `t` (seconds), flushing when the batch is full or due."""
+        self._times.append(t)
+        for path, value in values.items():
+            self._values.setdefault(path, []).append(value)
+        if (
+            len(self._times) >= self.max_samples
+            or time.perf_counter() - self._last_flush >= self.flush_period_s
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._times:
+            # The columnar API was reworked in rerun-sdk 0.23 (`TimeColumn`, `indexes=`/`columns=`)
+            if hasattr(rr, "TimeColumn"):
+                indexes = [rr.TimeColumn(self.timeline, duration=self._times)]
+                for path, values in self._values.items():
+                    rr.send_columns(path, indexes=indexes, columns=rr.Scalars.columns(scalars=values))
+            else:
+                times = [rr.TimeSecondsColumn(self.timeline, self._times)]
+                for path, values in self._values.items():
+                    rr.send_columns(path, times=times, components=[rr.components.ScalarBatch(values)])
+        self._times = []
+        self._values = {}
+        self._last_flush = time.perf_counter()
+
+
+def log_rerun_data(
+    schema: list[tuple[str, str, str, str]],
+    observation: dict,
+    action: dict,
+    last_images: dict[str, np.ndarray] | None = None,
+    scalar_batcher: RerunScalarBatcher | None = None,
+    t: float | None = None,
+    jpeg_quality: int | None = None,
+) -> None:
+    """
+    Logs the observation and action values listed in a schema from `make_rerun_log_schema`.
+
+    When `last_images` is given, it holds the last image logged for each entity, and an image that is the very
+    same array object is skipped (e.g. LeKiwiClient serving its cached frames when no new message arrived).
+    Only identity is checked: hashing every frame would cost more than it saves, as cameras hand out a new
+    array for each frame.
+    When `scalar_batcher` is given, scalars are added to it as one sample at time `t` instead of being logged
+    one by one.
+    When `jpeg_quality` is given, uint8 images are sent JPEG-compressed at that quality rather than as raw pixels,
+    which cuts the bytes rerun serializes per frame by an order of magnitude.
+    """
+    sources = {"observation": observation, "action": action}
+    scalars = {}
+    for source, key, path, kind in schema:
+        val = sources[source][key]
+        if kind == "scalar":
+            if scalar_batcher is not None:
+                scalars[path] = val
+            else:
+                rr.log(path, rr.Scalar(val))
+            continue
+        if last_images is not None:
+            if last_images.get(path) is val:
+                continue
+            last_images[path] = val
+        if jpeg_quality is not None and val.dtype == np.uint8:
+            rr.log(path, rr.Image(val).compress(jpeg_quality=jpeg_quality))
+        else:
+            rr.log(path, rr.Image(val))
+    if scalar_batcher is not None:
+        scalar_batcher.add(t, scalars)
@@ -41,9 +41,6 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from pprint import pformat
 
-import numpy as np
-import rerun as rr
-
 from lerobot.common.cameras import (  # noqa: F401
     CameraConfig,  # noqa: F401
 )
@@ -80,7 +77,7 @@ from lerobot.common.utils.utils import (
     init_logging,
     log_say,
 )
-from lerobot.common.utils.visualization_utils import _init_rerun
+from lerobot.common.utils.visualization_utils import _init_rerun, log_rerun_data, make_rerun_log_schema
 from lerobot.configs import parser
 from lerobot.configs.policies import PreTrainedConfig
 
@@ -177,6 +174,9 @@ def record_loop(
     if policy is not None:
         policy.reset()
 
+    # Resolved from the first displayed step, the observation and action keys don't change afterwards
+    log_schema = None
+    last_images = {}
     timestamp = 0
     start_episode_t = time.perf_counter()
     while timestamp < control_time_s:
@@ -221,14 +221,9 @@ def record_loop(
             dataset.add_frame(frame, task=single_task)
 
         if display_data:
-            for obs, val in observation.items():
-                if isinstance(val, float):
-                    rr.log(f"observation.{obs}", rr.Scalar(val))
-                elif isinstance(val, np.ndarray):
-                    rr.log(f"observation.{obs}", rr.Image(val), static=True)
-            for act, val in action.items():
-                if isinstance(val, float):
-                    rr.log(f"action.{act}", rr.Scalar(val))
+            if log_schema is None:
+                log_schema = make_rerun_log_schema(observation, action)
+            log_rerun_data(log_schema, observation, action, last_images)
 
         dt_s = time.perf_counter() - start_loop_t
         busy_wait(1 / fps - dt_s)
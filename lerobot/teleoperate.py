@@ -30,13 +30,17 @@ python -m lerobot.teleoperate \
 ```
 """
 
+import contextlib
 import logging
+import queue
+import sys
+import threading
 import time
+from collections import deque
 from dataclasses import asdict, dataclass
 from pprint import pformat
 
 import draccus
-import numpy as np
 import rerun as rr
 
 from lerobot.common.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
@@ -55,8 +59,13 @@ from lerobot.common.teleoperators import (
     make_teleoperator_from_config,
 )
 from lerobot.common.utils.robot_utils import busy_wait
-from lerobot.common.utils.utils import init_logging, move_cursor_up
-from lerobot.common.utils.visualization_utils import _init_rerun
+from lerobot.common.utils.utils import init_logging
+from lerobot.common.utils.visualization_utils import (
+    RerunScalarBatcher,
+    _init_rerun,
+    log_rerun_data,
+    make_rerun_log_schema,
+)
 
 from .common.teleoperators import gamepad, koch_leader, so100_leader, so101_leader  # noqa: F401
 
@@ -70,43 +79,161 @@ class TeleoperateConfig:
     teleop_time_s: float | None = None
     # Display all cameras on screen
     display_data: bool = False
+    # Rate at which observations are read for display and the terminal table is refreshed, independently of
+    # the control loop.
+    display_fps: float = 10
+    # JPEG quality of the camera frames sent to rerun, None sends them uncompressed.
+    display_jpeg_quality: int | None = 85
+
+
+def _put_latest(slot: queue.Queue, item) -> None:
+    """Puts `item` in a single-slot queue, replacing a value the consumer hasn't taken yet (drop-oldest)."""
+    with contextlib.suppress(queue.Empty):
+        slot.get_nowait()
+    slot.put_nowait(item)
+
+
+def _run_stage(step_fn, stop: threading.Event, errors: list[Exception]) -> None:
+    """Calls `step_fn` until `stop` is set. An exception stops the pipeline and is re-raised by the loop."""
+    try:
+        while not stop.is_set():
+            step_fn()
+    except Exception as e:
+        errors.append(e)
+        stop.set()
+
+
+def _wait_for_camera_frames(robot: Robot, timeout_s: float) -> None:
+    """
+    Waits until each of the robot's cameras has a frame that hasn't been read yet, so the `async_read` in
+    `robot.get_observation()` returns right away instead of blocking for up to a camera period.
+    """
+    for cam in getattr(robot, "cameras", {}).values():
+        new_frame_event = getattr(cam, "new_frame_event", None)
+        if new_frame_event is not None:
+            new_frame_event.wait(timeout_s)
 
 
 def teleop_loop(
-    teleop: Teleoperator, robot: Robot, fps: int, display_data: bool = False, duration: float | None = None
+    teleop: Teleoperator,
+    robot: Robot,
+    fps: int,
+    display_data: bool = False,
+    duration: float | None = None,
+    display_fps: float = 10,
+    display_jpeg_quality: int | None = None,
 ):
+    """
+    Runs teleoperation as a pipeline of three stages, so slow stages don't hold up the 1/fps actuation:
+    - acquire (thread): reads the leader at `fps` and keeps only its newest action,
+    - actuate (this thread): sends the newest action to the robot at `fps`,
+    - observe (thread, only with `display_data`): reads robot observations at `display_fps`,
+    - display (thread): rerun logging and the terminal table (refreshed at `display_fps`), dropping ticks it
+      can't keep up with.
+    Actuate and observe share the robot's bus, so their robot calls are serialized by a lock.
+    """
     display_len = max(len(key) for key in robot.action_features)
-    start = time.perf_counter()
-    while True:
-        loop_start = time.perf_counter()
-        action = teleop.get_action()
-        if display_data:
+    stop = threading.Event()
+    errors: list[Exception] = []
+    actions: queue.Queue = queue.Queue(maxsize=1)
+    ticks: queue.Queue = queue.Queue(maxsize=1)
+    # Nobody waits on new observations, so a deque(maxlen=1) is enough: its append (dropping the oldest) and
+    # popleft are atomic, without the mutex and condition variables of a queue.Queue
+    observations: deque = deque(maxlen=1)
+    robot_lock = threading.Lock()
+    # Resolved from the first logged step, the observation and action keys don't change afterwards
+    log_schema = None
+    last_images = {}
+    scalar_batcher = RerunScalarBatcher(timeline="robot") if display_data else None
+
+    table_header = "\n" + "-" * (display_len + 10) + "\n" + f"{'NAME':<{display_len}} | {'NORM':>7}\n"
+    row_fmt = f"{{:<{display_len}}} | {{:>7.2f}}\n"
+
+    def acquire():
+        # Paced at `fps` like actuation: keyboard and gamepad teleops answer instantly and would otherwise spin
+        # a core (and hold the GIL against actuation), leader arms would hammer their bus
+        acquire_start = time.perf_counter()
+        _put_latest(actions, teleop.get_action())
+        stop.wait(1 / fps - (time.perf_counter() - acquire_start))
+
+    def observe():
+        obs_start = time.perf_counter()
+        # The camera frame wait happens outside the lock, so actuation is only held up by the bus read
+        _wait_for_camera_frames(robot, 1 / display_fps)
+        with robot_lock:
             observation = robot.get_observation()
-            for obs, val in observation.items():
-                if isinstance(val, float):
-                    rr.log(f"observation_{obs}", rr.Scalar(val))
-                elif isinstance(val, np.ndarray):
-                    rr.log(f"observation_{obs}", rr.Image(val), static=True)
-            for act, val in action.items():
-                if isinstance(val, float):
-                    rr.log(f"action_{act}", rr.Scalar(val))
-
-        robot.send_action(action)
-        dt_s = time.perf_counter() - loop_start
-        busy_wait(1 / fps - dt_s)
-
-        loop_s = time.perf_counter() - loop_start
-
-        print("\n" + "-" * (display_len + 10))
-        print(f"{'NAME':<{display_len}} | {'NORM':>7}")
-        for motor, value in action.items():
-            print(f"{motor:<{display_len}} | {value:>7.2f}")
-        print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
-
-        if duration is not None and time.perf_counter() - start >= duration:
+        observations.append(observation)
+        stop.wait(1 / display_fps - (time.perf_counter() - obs_start))
+
+    last_table_write = 0.0
+
+    def display():
+        nonlocal log_schema, last_table_write
+        try:
+            action, loop_t, loop_s = ticks.get(timeout=0.1)
+        except queue.Empty:
+            return
+        # Only observations read since the previous tick are logged
+        observation = None
+        with contextlib.suppress(IndexError):
+            observation = observations.popleft()
+        if observation is not None:
+            if log_schema is None:
+                log_schema = make_rerun_log_schema(observation, action, sep="_")
+            # rerun-sdk 0.23 replaced set_time_seconds with set_time
+            if hasattr(rr, "set_time"):
+                rr.set_time("robot", duration=loop_t)
+            else:
+                rr.set_time_seconds("robot", loop_t)
+            log_rerun_data(
+                log_schema, observation, action, last_images, scalar_batcher, loop_t, display_jpeg_quality
+            )
+
+        now = time.perf_counter()
+        if now - last_table_write < 1 / display_fps:
             return
+        last_table_write = now
+        # The whole table goes out in one write, ending with the escape that moves the cursor back over it
+        rows = "".join(row_fmt.format(motor, value) for motor, value in action.items())
+        footer = f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)\n\033[{len(action) + 5}A"
+        sys.stdout.write(table_header + rows + footer)
+
+    stages = [
+        threading.Thread(target=_run_stage, args=(acquire, stop, errors), daemon=True),
+        threading.Thread(target=_run_stage, args=(display, stop, errors), daemon=True),
+    ]
+    if display_data:
+        stages.append(threading.Thread(target=_run_stage, args=(observe, stop, errors), daemon=True))
+    for stage in stages:
+        stage.start()
 
-        move_cursor_up(len(action) + 5)
+    start = time.perf_counter()
+    try:
+        while not stop.is_set():
+            loop_start = time.perf_counter()
+            try:
+                action = actions.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            with robot_lock:
+                robot.send_action(action)
+            dt_s = time.perf_counter() - loop_start
+            busy_wait(1 / fps - dt_s)
+
+            loop_s = time.perf_counter() - loop_start
+            _put_latest(ticks, (action, loop_start - start, loop_s))
+
+            if duration is not None and time.perf_counter() - start >= duration:
+                return
+    finally:
+        stop.set()
+        for stage in stages:
+            stage.join()
+        if scalar_batcher is not None:
+            scalar_batcher.flush()
+        if errors:
+            raise errors[0]
 
 
 @draccus.wrap()
@@ -123,7 +250,15 @@ def teleoperate(cfg: TeleoperateConfig):
     robot.connect()
 
     try:
-        teleop_loop(teleop, robot, cfg.fps, display_data=cfg.display_data, duration=cfg.teleop_time_s)
+        teleop_loop(
+            teleop,
+            robot,
+            cfg.fps,
+            display_data=cfg.display_data,
+            duration=cfg.teleop_time_s,
+            display_fps=cfg.display_fps,
+            display_jpeg_quality=cfg.display_jpeg_quality,
+        )
     except KeyboardInterrupt:
         pass
     finally:
@@ -186,3 +186,8 @@ def test_rotation(rotation, index_or_path):
         assert camera.width == original_width
         assert camera.height == original_height
         assert img.shape[:2] == (original_height, original_width)
+
+
+def test_invalid_fourcc_config():
+    with pytest.raises(ValueError):
+        OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH, fourcc="MJPEG")
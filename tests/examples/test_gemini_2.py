@@ -0,0 +1,34 @@
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+pytest.importorskip("google.genai")
+pytest.importorskip("numba")
+
+from examples.gemini_2 import parse_json  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ('[{"label": "cup"}]', '[{"label": "cup"}]'),
+        ('```json\n[{"label": "cup"}]\n```', '[{"label": "cup"}]'),
+        ('Here you go:\n```json\n[{"label": "cup"}]\n```\nDone.', '[{"label": "cup"}]'),
+        ("```python\n[3]```", "[3]"),
+        ("```\n[3]\n```", "[3]"),
+        ('```json\n[{"label": "cup"}]', '[{"label": "cup"}]'),
+    ],
+)
+def test_parse_json_strips_fences(response, expected):
+    assert parse_json(response) == expected
@@ -93,3 +93,30 @@ def test_send_action(follower):
 
     goal_pos = {m: (i + 1) * 10 for i, m in enumerate(follower.bus.motors)}
     follower.bus.sync_write.assert_called_once_with("Goal_Position", goal_pos)
+
+
+def test_send_action_skips_unchanged_goal(follower):
+    follower.connect()
+
+    action = {f"{m}.pos": i * 10 for i, m in enumerate(follower.bus.motors, 1)}
+    follower.send_action(action)
+    returned = follower.send_action(dict(action))
+
+    assert returned == action
+    follower.bus.sync_write.assert_called_once()
+
+    follower.send_action({**action, "gripper.pos": 0})
+    assert follower.bus.sync_write.call_count == 2
+
+
+def test_send_action_refreshes_unchanged_goal(follower):
+    follower.connect()
+
+    action = {f"{m}.pos": i * 10 for i, m in enumerate(follower.bus.motors, 1)}
+    for _ in range(follower.config.goal_refresh_every + 1):
+        follower.send_action(action)
+    follower.bus.sync_write.assert_called_once()
+
+    # The unchanged goal is written again, in case the earlier unacknowledged write was lost
+    follower.send_action(action)
+    assert follower.bus.sync_write.call_count == 2
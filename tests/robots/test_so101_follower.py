@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lerobot.common.robots.so101_follower import (
+    SO101Follower,
+    SO101FollowerConfig,
+)
+
+
+def _make_bus_mock() -> MagicMock:
+    """Return a bus mock with just the attributes used by the robot."""
+    bus = MagicMock(name="FeetechBusMock")
+    bus.is_connected = False
+
+    def _connect():
+        bus.is_connected = True
+
+    def _disconnect(_disable=True):
+        bus.is_connected = False
+
+    bus.connect.side_effect = _connect
+    bus.disconnect.side_effect = _disconnect
+
+    @contextmanager
+    def _dummy_cm():
+        yield
+
+    bus.torque_disabled.side_effect = _dummy_cm
+
+    return bus
+
+
+@pytest.fixture
+def follower():
+    bus_mock = _make_bus_mock()
+
+    def _bus_side_effect(*_args, **kwargs):
+        bus_mock.motors = kwargs["motors"]
+        motors_order: list[str] = list(bus_mock.motors)
+
+        bus_mock.sync_read.return_value = {motor: idx for idx, motor in enumerate(motors_order, 1)}
+        bus_mock.sync_write.return_value = None
+        bus_mock.write.return_value = None
+        bus_mock.disable_torque.return_value = None
+        bus_mock.enable_torque.return_value = None
+        bus_mock.is_calibrated = True
+        return bus_mock
+
+    with (
+        patch(
+            "lerobot.common.robots.so101_follower.so101_follower.FeetechMotorsBus",
+            side_effect=_bus_side_effect,
+        ),
+        patch.object(SO101Follower, "configure", lambda self: None),
+    ):
+        cfg = SO101FollowerConfig(port="/dev/null")
+        robot = SO101Follower(cfg)
+        yield robot
+        if robot.is_connected:
+            robot.disconnect()
+
+
+def test_send_action_skips_unchanged_goal(follower):
+    follower.connect()
+
+    action = {f"{m}.pos": i * 10 for i, m in enumerate(follower.bus.motors, 1)}
+    follower.send_action(action)
+    returned = follower.send_action(dict(action))
+
+    assert returned == action
+    follower.bus.sync_write.assert_called_once()
+
+    follower.send_action({**action, "gripper.pos": 0})
+    assert follower.bus.sync_write.call_count == 2
+
+
+def test_send_action_refreshes_unchanged_goal(follower):
+    follower.connect()
+
+    action = {f"{m}.pos": i * 10 for i, m in enumerate(follower.bus.motors, 1)}
+    for _ in range(follower.config.goal_refresh_every + 1):
+        follower.send_action(action)
+    follower.bus.sync_write.assert_called_once()
+
+    # The unchanged goal is written again, in case the earlier unacknowledged write was lost
+    follower.send_action(action)
+    assert follower.bus.sync_write.call_count == 2
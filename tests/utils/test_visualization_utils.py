@@ -0,0 +1,118 @@
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+from lerobot.common.utils import visualization_utils
+from lerobot.common.utils.visualization_utils import (
+    RerunScalarBatcher,
+    log_rerun_data,
+    make_rerun_log_schema,
+)
+
+
+def test_make_rerun_log_schema():
+    observation = {
+        "shoulder_pan.pos": 1.0,
+        "front": np.zeros((48, 64, 3), dtype=np.uint8),
+        "depth": np.zeros((48, 64), dtype=np.uint16),
+        "mask": np.zeros((48, 64), dtype=bool),
+        "name": "not logged",
+    }
+    action = {"shoulder_pan.pos": 2.0, "frame": np.zeros((48, 64, 3), dtype=np.uint8)}
+
+    schema = make_rerun_log_schema(observation, action)
+
+    assert schema == [
+        ("observation", "shoulder_pan.pos", "observation.shoulder_pan.pos", "scalar"),
+        ("observation", "front", "observation.front", "image"),
+        ("observation", "depth", "observation.depth", "image"),
+        ("observation", "mask", "observation.mask", "image"),
+        ("action", "shoulder_pan.pos", "action.shoulder_pan.pos", "scalar"),
+    ]
+
+
+def test_make_rerun_log_schema_separator():
+    schema = make_rerun_log_schema(
+        {"wrist": np.zeros((8, 8, 3), dtype=np.uint8)}, {"gripper.pos": 0.5}, sep="_"
+    )
+
+    assert schema == [
+        ("observation", "wrist", "observation_wrist", "image"),
+        ("action", "gripper.pos", "action_gripper.pos", "scalar"),
+    ]
+
+
+def test_log_rerun_data_skips_unchanged_images(monkeypatch):
+    logged = []
+    monkeypatch.setattr(visualization_utils.rr, "log", lambda path, data: logged.append(path))
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    schema = make_rerun_log_schema({"front": frame}, {})
+    last_images = {}
+
+    log_rerun_data(schema, {"front": frame}, {}, last_images)
+    log_rerun_data(schema, {"front": frame}, {}, last_images)
+    assert logged == ["observation.front"]
+
+    # A new array is logged even when its pixels are equal
+    log_rerun_data(schema, {"front": frame.copy()}, {}, last_images)
+    assert logged == ["observation.front", "observation.front"]
+
+    # Without a cache every frame is logged
+    log_rerun_data(schema, {"front": frame}, {})
+    log_rerun_data(schema, {"front": frame}, {})
+    assert len(logged) == 4
+
+
+def test_log_rerun_data_compresses_uint8_images(monkeypatch):
+    logged = {}
+    monkeypatch.setattr(visualization_utils.rr, "log", lambda path, data: logged.update({path: data}))
+    observation = {
+        "front": np.zeros((8, 8, 3), dtype=np.uint8),
+        "depth": np.zeros((8, 8), dtype=np.float32),
+    }
+    schema = make_rerun_log_schema(observation, {})
+
+    log_rerun_data(schema, observation, {}, jpeg_quality=85)
+
+    assert isinstance(logged["observation.front"], visualization_utils.rr.EncodedImage)
+    assert isinstance(logged["observation.depth"], visualization_utils.rr.Image)
+
+
+def test_rerun_scalar_batcher(monkeypatch):
+    sent = []
+
+    def send_columns(path, indexes, columns):
+        (index,) = indexes
+        assert index.timeline_name() == "robot"
+        times = [t.total_seconds() for t in index.times.to_pylist()]
+        scalars = next(iter(columns)).as_arrow_array()
+        sent.append((path, times, scalars.flatten().to_pylist()))
+
+    monkeypatch.setattr(visualization_utils.rr, "send_columns", send_columns)
+    batcher = RerunScalarBatcher(flush_period_s=3600, max_samples=3)
+
+    batcher.add(0.0, {"action_a": 1.0, "action_b": 2.0})
+    batcher.add(0.1, {"action_a": 3.0, "action_b": 4.0})
+    assert sent == []
+
+    batcher.add(0.2, {"action_a": 5.0, "action_b": 6.0})
+    assert sent == [
+        ("action_a", [0.0, 0.1, 0.2], [1.0, 3.0, 5.0]),
+        ("action_b", [0.0, 0.1, 0.2], [2.0, 4.0, 6.0]),
+    ]
+
+    sent.clear()
+    batcher.add(0.3, {"action_a": 7.0, "action_b": 8.0})
+    batcher.flush()
+    assert sent == [("action_a", [0.3], [7.0]), ("action_b", [0.3], [8.0])]